@@ -10,6 +10,7 @@ Handles:
 
 import json
 import logging
+import os
 import subprocess
 import threading
 from typing import List, Dict, Any, Optional, Callable
@@ -762,13 +763,24 @@ class MCPLoader:
             if not url:
                 return {"error": "URL required"}
 
+            max_length = input_args.get("max_length", 10000)
             try:
-                response = httpx.get(url, timeout=30, follow_redirects=True)
-                response.raise_for_status()
-
-                # Simple HTML to text conversion
-                content = response.text
-                max_length = input_args.get("max_length", 10000)
+                # Stream the body and stop once max_length characters are
+                # buffered, so large documents are never held in memory whole
+                with httpx.stream(
+                    "GET", url, timeout=30, follow_redirects=True
+                ) as response:
+                    response.raise_for_status()
+
+                    chunks: List[str] = []
+                    received = 0
+                    for chunk in response.iter_text():
+                        chunks.append(chunk)
+                        received += len(chunk)
+                        if received > max_length:
+                            break
+
+                content = "".join(chunks)
                 if len(content) > max_length:
                     content = content[:max_length] + "... (truncated)"
 
@@ -789,8 +801,6 @@ class MCPLoader:
     ) -> Any:
         """Execute a FS/Filesystem integration tool."""
         # For PoC, implement basic file operations in /tmp/agent-workspace
-        import os
-
         base_path = "/tmp/agent-workspace"
         os.makedirs(base_path, exist_ok=True)
 
@@ -833,8 +843,6 @@ class MCPLoader:
         input_args: Dict[str, Any],
     ) -> Any:
         """Execute a SEARCH/Brave integration tool."""
-        import os
-
         api_key = os.environ.get("BRAVE_API_KEY")
         if not api_key:
             return {"error": "Brave API key not configured"}
@@ -180,13 +180,7 @@ class AgentRegistry:
         """Load all Agent nodes from the graph."""
         agents = []
 
-        for node in self._storage.nodes.values():
-            node_type = (
-                node.type.value if hasattr(node.type, "value") else str(node.type)
-            )
-            if node_type != "Agent":
-                continue
-
+        for node in self._storage.get_nodes_by_type("Agent"):
             try:
                 config = AgentConfig.from_node(node)
                 agents.append(config)
@@ -39,6 +39,9 @@ class MockGraphStorage:
     def __init__(self, nodes: List[MockNode] = None):
         self.nodes = {n.id: n for n in (nodes or [])}
 
+    def get_nodes_by_type(self, type_name: str):
+        return [n for n in self.nodes.values() if n.type == type_name]
+
     def get_node(self, node_id: str) -> Optional[MockNode]:
         return self.nodes.get(node_id)
 
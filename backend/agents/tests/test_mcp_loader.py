@@ -556,3 +556,55 @@ class TestConnectHttpInfoQuery:
         tools = loader._connect_http(integration)
 
         assert tools == []
+
+
+class TestFetchTool:
+    """Tests for the built-in WEB fetch tool."""
+
+    @staticmethod
+    def _mock_stream(body: str, read_log: list):
+        import httpx2 as httpx
+
+        def stream_body():
+            for i in range(0, len(body), 100):
+                read_log.append(i)
+                yield body[i : i + 100].encode()
+
+        def handler(request):
+            return httpx.Response(
+                200,
+                content=stream_body(),
+                headers={"content-type": "text/plain; charset=utf-8"},
+            )
+
+        client = httpx.Client(transport=httpx.MockTransport(handler))
+        return lambda method, url, **kwargs: client.stream(method, url)
+
+    def test_fetch_truncates_and_stops_reading(self):
+        """Large bodies are truncated without reading past max_length."""
+        read_log: list = []
+        loader = MCPLoader([])
+        with patch(
+            "backend.agents.mcp_loader.httpx.stream",
+            self._mock_stream("x" * 10_000, read_log),
+        ):
+            result = loader._execute_fetch_tool(
+                "fetch", {"url": "http://example.test/doc", "max_length": 250}
+            )
+
+        assert result["status"] == 200
+        assert result["content"] == "x" * 250 + "... (truncated)"
+        assert len(read_log) < 10
+
+    def test_fetch_returns_short_body_unchanged(self):
+        read_log: list = []
+        loader = MCPLoader([])
+        with patch(
+            "backend.agents.mcp_loader.httpx.stream",
+            self._mock_stream("hello", read_log),
+        ):
+            result = loader._execute_fetch_tool(
+                "fetch", {"url": "http://example.test/doc"}
+            )
+
+        assert result["content"] == "hello"
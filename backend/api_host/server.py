@@ -273,7 +273,9 @@ def create_app(
     mount_mcp(app, mcp, tools_map)
 
     # Direct tool-execution and export endpoints
-    register_tool_routes(app, graph_service, tools_map, _auth_active)
+    register_tool_routes(
+        app, graph_service, tools_map, _auth_active, session_registry=session_registry
+    )
 
     # System / operability routes (favicon, health, info, logout, …).
     # Their paths are disjoint from the /web and /widget static mounts, so the
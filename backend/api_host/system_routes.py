@@ -10,6 +10,7 @@ import os
 import time
 from pathlib import Path
 from typing import Any, Dict
+from urllib.parse import quote
 
 from fastapi import FastAPI
 from fastapi.responses import JSONResponse, RedirectResponse, FileResponse, HTMLResponse
@@ -131,8 +132,6 @@ def register_system_routes(
         ),
     ) -> RedirectResponse:
         """Redirect collect kiosk URL to the web app in collect mode."""
-        from urllib.parse import quote
-
         return RedirectResponse(
             url=f"/web/?collect={quote(short_name, safe='')}", status_code=302
         )
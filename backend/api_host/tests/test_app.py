@@ -5,6 +5,7 @@ Tests that the FastAPI application is properly configured and
 all REST API endpoints function correctly.
 """
 
+import json
 import os
 from pathlib import Path
 from unittest.mock import patch
@@ -625,6 +626,35 @@ class TestExportEndpoints:
         assert data["export_boundary"]["export_kind"] == "full"
         assert data["export_boundary"]["selection_mode"] == "default"
 
+    def test_export_graph_legacy_endpoint_streams_full_payload(
+        self, test_app: TestClient
+    ):
+        """Streamed legacy export decodes to the same payload as /api/export."""
+        streamed = test_app.get("/export_graph")
+        buffered = test_app.get("/api/export")
+        assert streamed.headers["content-type"] == "application/json"
+
+        streamed_data = streamed.json()
+        buffered_data = buffered.json()
+        streamed_data.pop("exportDate")
+        buffered_data.pop("exportDate")
+        assert streamed_data == buffered_data
+        assert len(streamed_data["nodes"]) == streamed_data["total_nodes"] == 3
+
+    def test_iter_export_json_batches_list_items(self):
+        """Batched export chunks join into the same JSON as a single dump."""
+        from backend.service.serializers import iter_export_json
+
+        payload = {
+            "nodes": [{"id": str(i), "name": "ä"} for i in range(5)],
+            "edges": [],
+            "total_nodes": 5,
+        }
+        chunks = list(iter_export_json(payload, batch_size=2))
+        assert json.loads(b"".join(chunks)) == payload
+        # "{", key, 3 node batches, "]", edges key, "]", total, "}"
+        assert len(chunks) == 10
+
     def test_export_graph_error_hides_traceback(self, test_app: TestClient):
         """A failing export returns a generic 500 with no traceback leaked."""
         graph_service = test_app.app.state.graph_service
@@ -1,15 +1,17 @@
 """Direct tool-execution and graph-export endpoints for the api_host application."""
 
-import json
+import asyncio
 import logging
 import secrets
 from typing import Any, Optional
 
 from fastapi import FastAPI
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 from starlette.requests import Request
 
-from backend.service import GraphService, json_serializer
+from backend.core.session_registry import SessionRegistry
+from backend.service import GraphService
+from backend.service.serializers import dump_json_bytes, iter_export_json
 from backend.runtime.authorization import use_request_authorization
 
 logger = logging.getLogger(__name__)
@@ -48,11 +50,24 @@ def access_denied_json_response(result: Any) -> Optional[JSONResponse]:
     return None
 
 
+def _call_with_request_authorization(headers: Any, func: Any, arguments: dict) -> Any:
+    with use_request_authorization(headers=headers):
+        return func(**arguments)
+
+
+class ToolJSONResponse(JSONResponse):
+    """JSONResponse that encodes tool results (incl. datetimes) in one pass."""
+
+    def render(self, content: Any) -> bytes:
+        return dump_json_bytes(content)
+
+
 def register_tool_routes(
     app: FastAPI,
     graph_service: GraphService,
     tools_map: dict,
     auth_active: bool,
+    session_registry: Optional[SessionRegistry] = None,
 ) -> None:
     """Register /execute_tool and /export_graph."""
 
@@ -86,15 +101,25 @@ def register_tool_routes(
                     {"error": f"Tool {tool_name} not found"}, status_code=404
                 )
 
-            func = tools_map[tool_name]
-            with use_request_authorization(headers=request.headers):
-                result = func(**arguments)
+            # Tools are synchronous (storage I/O, embeddings, federation
+            # calls); run them in a worker thread so the loop keeps serving.
+            # Thread safety: GraphStorage serializes reads and writes on its _lock.
+            # Visualization pushes from that thread go through the registry's
+            # thread-safe path, which needs to know this loop.
+            if session_registry is not None:
+                session_registry.ensure_event_loop(asyncio.get_running_loop())
+            result = await asyncio.to_thread(
+                _call_with_request_authorization,
+                request.headers,
+                tools_map[tool_name],
+                arguments,
+            )
 
             access_denied_response = access_denied_json_response(result)
             if access_denied_response is not None:
                 return access_denied_response
 
-            return JSONResponse(json.loads(json.dumps(result, default=json_serializer)))
+            return ToolJSONResponse(result)
         except Exception:
             # Log the full detail server-side; return only a correlation id so
             # internal paths / stack frames are never disclosed to the caller.
@@ -110,17 +135,24 @@ def register_tool_routes(
             )
 
     @app.get("/export_graph")
-    async def export_graph_endpoint(request: Request) -> JSONResponse:
+    async def export_graph_endpoint(request: Request):
         """Export the entire graph (all nodes and edges)."""
         try:
-            with use_request_authorization(headers=request.headers):
-                result = graph_service.export_graph()
+            # Worker thread; GraphStorage serializes reads and writes on its _lock.
+            result = await asyncio.to_thread(
+                _call_with_request_authorization,
+                request.headers,
+                graph_service.export_graph,
+                {},
+            )
 
             access_denied_response = access_denied_json_response(result)
             if access_denied_response is not None:
                 return access_denied_response
 
-            return JSONResponse(result)
+            return StreamingResponse(
+                iter_export_json(result), media_type="application/json"
+            )
         except Exception:
             # Never return the traceback to the client (leaks internal paths and
             # code structure); log it server-side against a correlation id.
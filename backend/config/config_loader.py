@@ -14,6 +14,7 @@ defaulting to config/default/schema_config.json.
 import os
 import json
 import logging
+import threading
 from typing import Dict, List, Optional, Any
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 
@@ -408,14 +409,20 @@ class ConfigLoader:
 
 # Module-level singleton instance
 _loader: Optional[ConfigLoader] = None
+# Serializes first construction; tool and chat calls run on worker threads
+_loader_lock = threading.Lock()
 
 
 def _get_loader() -> ConfigLoader:
     """Get or create the ConfigLoader singleton."""
     global _loader
-    if _loader is None:
-        _loader = ConfigLoader()
-    return _loader
+    loader = _loader
+    if loader is None:
+        with _loader_lock:
+            if _loader is None:
+                _loader = ConfigLoader()
+            loader = _loader
+    return loader
 
 
 def get_schema() -> Dict[str, Any]:
@@ -604,6 +611,11 @@ def get_request_graph_selection_info() -> Dict[str, Any]:
     return get_public_request_graph_selection_context()
 
 
+def get_schema_config() -> SchemaConfig:
+    """Get the live schema model; a new object is created on every (re)load."""
+    return _get_loader().config.schema_
+
+
 def get_node_type_names() -> List[str]:
     """Get list of all node type names."""
     loader = _get_loader()
@@ -649,8 +661,9 @@ def reload_config() -> None:
 def reset_loader() -> None:
     """Reset the loader (for testing purposes)."""
     global _loader
-    _loader = None
-    ConfigLoader.reset_instance()
+    with _loader_lock:
+        _loader = None
+        ConfigLoader.reset_instance()
 
 
 def get_skills_config() -> SkillsConfig:
@@ -64,6 +64,8 @@ from .models import (
     AddNodesResult,
     DeleteNodesResult,
     DeleteEdgesResult,
+    # Serialization helpers
+    json_serializer,
 )
 
 # Event system
@@ -105,6 +107,8 @@ __all__ = [
     "AddNodesResult",
     "DeleteNodesResult",
     "DeleteEdgesResult",
+    # Serialization helpers
+    "json_serializer",
     # Event system
     "EventContext",
     "EventOrigin",
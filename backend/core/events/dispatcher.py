@@ -99,13 +99,7 @@ class EventDispatcher:
         subscriptions = []
 
         # Search for EventSubscription nodes
-        for node in self._storage.nodes.values():
-            node_type = (
-                node.type.value if hasattr(node.type, "value") else str(node.type)
-            )
-            if node_type != "EventSubscription":
-                continue
-
+        for node in self._storage.get_nodes_by_type("EventSubscription"):
             metadata = node.metadata or {}
 
             # Parse filters
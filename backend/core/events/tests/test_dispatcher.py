@@ -30,6 +30,9 @@ class MockStorage:
     def __init__(self, nodes: List[MockNode] = None):
         self.nodes = {n.id: n for n in (nodes or [])}
 
+    def get_nodes_by_type(self, type_name: str):
+        return [n for n in self.nodes.values() if n.type == type_name]
+
 
 def create_subscription_node(
     id: str,
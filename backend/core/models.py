@@ -10,9 +10,11 @@ See backend/config/config_loader.py for configuration loading.
 """
 
 from enum import Enum
-from typing import Optional, List, Dict, Any, Union
+from typing import Optional, List, Dict, Any, FrozenSet, Set, Tuple, Union
 from datetime import datetime, timezone
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, PrivateAttr, field_validator
+import json
+import sys
 import uuid
 
 
@@ -158,7 +160,84 @@ NODE_COLORS = {
 }
 
 
-class Node(BaseModel):
+# Direct value -> member lookups for the validators below; skips
+# Enum.__call__ and the ValueError raised for schema-defined type strings.
+# Other type strings, tags and subtypes repeat across many nodes and are
+# interned, so loaded graphs share one object per distinct value.
+_NODE_TYPE_BY_VALUE = {member.value: member for member in NodeType}
+_RELATIONSHIP_TYPE_BY_VALUE = {member.value: member for member in RelationshipType}
+
+
+def json_serializer(obj: Any) -> Any:
+    """
+    Custom JSON serializer for objects not serializable by default.
+
+    Handles:
+    - datetime objects -> ISO format strings
+    """
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class _RevisionedModel(BaseModel):
+    """Model that counts field assignments, so derived data can be cached.
+
+    ``_revision`` is bumped on every public attribute assignment (as done by
+    ``GraphStorage.update_node``). The outputs cached by ``to_json_cached``
+    and ``to_dict_cached`` are only reused while the revision still matches.
+    In-place mutation of a list or dict field (e.g. ``node.tags.append(...)``)
+    is not an assignment and does not bump the revision; reassign the field
+    instead so cached output is refreshed.
+    """
+
+    _revision: int = PrivateAttr(default=0)
+    _json_cache: Optional[Tuple[int, FrozenSet[str], str]] = PrivateAttr(default=None)
+    _dict_cache: Optional[Tuple[int, dict]] = PrivateAttr(default=None)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if not name.startswith("_"):
+            super().__setattr__("_revision", self._revision + 1)
+
+    def model_copy(self, *, update=None, deep: bool = False):
+        copied = super().model_copy(update=update, deep=deep)
+        # update= bypasses __setattr__, so never inherit cached output
+        copied._json_cache = None
+        copied._dict_cache = None
+        return copied
+
+    def to_json_cached(self, exclude: Optional[Set[str]] = None) -> str:
+        """Return the JSON text of ``model_dump(exclude=exclude)``.
+
+        Datetimes are encoded with ``isoformat()``. The text is reused while
+        the revision and the exclude set are unchanged; in-place mutation of
+        list/dict fields does not invalidate it (see the class docstring).
+        """
+        key = frozenset(exclude or ())
+        revision = self._revision
+        cached = self._json_cache
+        if cached is not None and cached[0] == revision and cached[1] == key:
+            return cached[2]
+        text = json.dumps(self.model_dump(exclude=exclude), default=json_serializer)
+        self._json_cache = (revision, key, text)
+        return text
+
+    def to_dict_cached(self) -> dict:
+        """Return the subclass's ``to_dict()``, reusing it while unchanged.
+
+        The returned dict is shared: callers must treat it as read-only.
+        """
+        revision = self._revision
+        cached = self._dict_cache
+        if cached is not None and cached[0] == revision:
+            return cached[1]
+        data = self.to_dict()
+        self._dict_cache = (revision, data)
+        return data
+
+
+class Node(_RevisionedModel):
     """Base model for a node in the graph"""
 
     id: str = Field(default_factory=lambda: str(uuid.uuid4()))
@@ -185,14 +264,17 @@ class Node(BaseModel):
         if isinstance(v, NodeType):
             return v
         if isinstance(v, str):
-            # Try to convert to enum for backward compatibility
-            try:
-                return NodeType(v)
-            except ValueError:
-                # Accept any string type (config-defined or legacy)
-                return v
+            # Convert to enum for backward compatibility; accept any other
+            # string type (config-defined or legacy) as-is
+            return _NODE_TYPE_BY_VALUE.get(v) or sys.intern(v)
         raise ValueError(f"Node type must be string or NodeType, got {type(v)}")
 
+    @field_validator("tags", "subtypes")
+    @classmethod
+    def intern_labels(cls, v: List[str]) -> List[str]:
+        """Intern tag/subtype strings; the same few labels recur across nodes."""
+        return [sys.intern(label) for label in v]
+
     @property
     def type_str(self) -> str:
         """Get the type as a string (works with both enum and string types)."""
@@ -221,7 +303,7 @@ class Node(BaseModel):
         return get_node_color(self.type_str)
 
 
-class Edge(BaseModel):
+class Edge(_RevisionedModel):
     """Model for an edge (relationship) between nodes"""
 
     id: str = Field(default_factory=lambda: str(uuid.uuid4()))
@@ -243,12 +325,9 @@ class Edge(BaseModel):
         if isinstance(v, RelationshipType):
             return v
         if isinstance(v, str):
-            # Try to convert to enum for backward compatibility
-            try:
-                return RelationshipType(v)
-            except ValueError:
-                # Accept any string as a free-form relationship type
-                return v
+            # Convert to enum for backward compatibility; accept any other
+            # string as a free-form relationship type
+            return _RELATIONSHIP_TYPE_BY_VALUE.get(v) or sys.intern(v)
         raise ValueError(
             f"Relationship type must be string or RelationshipType, got {type(v)}"
         )
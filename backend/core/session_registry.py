@@ -19,10 +19,11 @@ tools directly from the event loop thread (not via asyncio.to_thread),
 so asyncio.get_running_loop() always succeeds inside push_command_sync
 and the call_soon fast path is taken in normal operation.
 
-The call_soon_threadsafe fallback path exists as a safety net for
-callers that genuinely run in a separate thread (e.g. background workers
-or future framework changes).  In that case the loop reference injected
-at startup via set_event_loop() is used instead.
+The call_soon_threadsafe fallback path serves callers that run in a
+separate thread: the HTTP ``/execute_tool`` endpoint offloads tools to a
+worker thread, as do background workers.  In that case the loop reference
+injected at startup via set_event_loop() (or recorded by the endpoint via
+ensure_event_loop()) is used instead.
 
 Single-consumer design (V1 known limitation)
 --------------------------------------------
@@ -61,6 +62,11 @@ class SessionRegistry:
         """Store a reference to the running event loop for thread-safe pushes."""
         self._loop = loop
 
+    def ensure_event_loop(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Record *loop* for thread-safe pushes unless a live loop is already set."""
+        if self._loop is None or self._loop.is_closed():
+            self._loop = loop
+
     # ------------------------------------------------------------------
     # Validation
     # ------------------------------------------------------------------
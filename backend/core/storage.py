@@ -51,12 +51,20 @@ if TYPE_CHECKING:
     from .history_store import GraphHistoryStore
 
 
+# Node types holding saved visualization views
+VIEW_NODE_TYPES = frozenset(
+    {NodeType.SAVED_VIEW.value, NodeType.VISUALIZATION_VIEW.value}
+)
+
+
 class GraphStorage:
     """
     Manages graph storage with NetworkX + JSON persistence.
 
     Thread-safety:
     - All public methods that modify state are protected by _lock (threading.RLock)
+    - Public read methods that walk nodes, edges, the graph or the vector store
+      hold _lock too, so callers on worker threads never see a half-applied write
     - File operations use OS-level file locking for multi-process safety
     - Writes are atomic (temp file + rename) to prevent corruption
     """
@@ -128,10 +136,27 @@ class GraphStorage:
         # Cache for searchable text to speed up search_nodes
         self._searchable_text_cache: Dict[str, str] = {}
 
+        # Word -> node IDs over the cached searchable text, used to narrow
+        # search_nodes candidates before the substring test. Maintained
+        # alongside the text cache, so it is complete as soon as load() ends.
+        self._token_index: Dict[str, set] = {}
+
         # Cache: node_type_key -> "typeName label1 label2 ..." (lowercased)
         self._type_searchable_text: Dict[str, str] = {}
         self._build_type_searchable_text()
 
+        # Node type -> node IDs (insertion ordered), kept in step with
+        # self.nodes so per-type lookups and get_stats() skip a graph walk
+        self._node_ids_by_type: Dict[str, Dict[str, None]] = {}
+
+        # Saved-view name -> view node IDs (insertion ordered), so views can be
+        # fetched by name without a text search
+        self._view_ids_by_name: Dict[str, Dict[str, None]] = {}
+
+        # Node ID -> lowercased name (graph order), matched against by
+        # find_similar_nodes instead of lowercasing every name per call
+        self._names_lower: Dict[str, str] = {}
+
         self.graph_metadata: Dict[str, Any] = {
             "version": "1.0",
             "graph_name": self._default_graph_name(),
@@ -182,6 +207,41 @@ class GraphStorage:
     def _build_searchable_text(self, node: "Node") -> str:
         return storage_search.build_searchable_text(node, self._type_searchable_text)
 
+    def _cache_searchable_text(self, node: "Node") -> None:
+        self._uncache_searchable_text(node.id)
+        text = self._build_searchable_text(node)
+        self._searchable_text_cache[node.id] = text
+        storage_search.index_searchable_text(self._token_index, node.id, text)
+
+    def _uncache_searchable_text(self, node_id: str) -> None:
+        text = self._searchable_text_cache.pop(node_id, None)
+        if text is not None:
+            storage_search.unindex_searchable_text(self._token_index, node_id, text)
+
+    def _track_node(self, node: "Node", delta: int) -> None:
+        """Add (+1) or remove (-1) *node* from the per-type, name and view indexes."""
+        type_ids = self._node_ids_by_type.setdefault(node.type_str, {})
+        if delta > 0:
+            type_ids[node.id] = None
+            self._names_lower[node.id] = node.name.lower()
+        else:
+            type_ids.pop(node.id, None)
+            self._names_lower.pop(node.id, None)
+        if not type_ids:
+            del self._node_ids_by_type[node.type_str]
+        self._track_view_name(node, delta)
+
+    def _track_view_name(self, node: "Node", delta: int) -> None:
+        """Add (+1) or remove (-1) a saved-view *node* from the view-name index."""
+        if node.type_str in VIEW_NODE_TYPES:
+            view_ids = self._view_ids_by_name.setdefault(node.name, {})
+            if delta > 0:
+                view_ids[node.id] = None
+            else:
+                view_ids.pop(node.id, None)
+            if not view_ids:
+                del self._view_ids_by_name[node.name]
+
     def add_system_listener(self, listener: Callable[["Event"], None]) -> None:
         """
         Add a system-level event listener.
@@ -374,19 +434,24 @@ class GraphStorage:
                 self.edges.clear()
                 self.graph.clear()
 
-                # Clear searchable text cache
+                # Clear searchable text cache and type counters
                 self._searchable_text_cache.clear()
+                self._token_index.clear()
+                self._node_ids_by_type.clear()
+                self._view_ids_by_name.clear()
+                self._names_lower.clear()
 
                 # Load nodes
                 for node_data in data.get("nodes", []):
                     node = Node.from_dict(node_data)
+                    if node.id in self.nodes:
+                        self._track_node(self.nodes[node.id], -1)
                     self.nodes[node.id] = node
+                    self._track_node(node, 1)
                     self.graph.add_node(node.id, data=node)
 
                     # Precompute searchable text
-                    self._searchable_text_cache[node.id] = self._build_searchable_text(
-                        node
-                    )
+                    self._cache_searchable_text(node)
 
                 # Load edges
                 for edge_data in data.get("edges", []):
@@ -419,9 +484,11 @@ class GraphStorage:
         Thread-safe: Uses lock for reading in-memory data.
         """
         with self._lock:
+            # Unchanged nodes/edges reuse their previous dicts; the writer
+            # thread only reads them
             data = {
-                "nodes": [node.to_dict() for node in self.nodes.values()],
-                "edges": [edge.to_dict() for edge in self.edges.values()],
+                "nodes": [node.to_dict_cached() for node in self.nodes.values()],
+                "edges": [edge.to_dict_cached() for edge in self.edges.values()],
                 "metadata": {
                     **(self.graph_metadata or {}),
                     "version": (self.graph_metadata or {}).get("version", "1.0"),
@@ -497,26 +564,49 @@ class GraphStorage:
         self, query: str, node_types: Optional[List[NodeType]] = None, limit: int = 50
     ) -> List[Node]:
         """Search nodes based on text query.  Delegates to storage_search."""
-        return storage_search.search_nodes(
-            self.nodes,
-            self._searchable_text_cache,
-            self._type_searchable_text,
-            query,
-            node_types,
-            limit,
-        )
+        with self._lock:
+            return storage_search.search_nodes(
+                self.nodes,
+                self._searchable_text_cache,
+                self._type_searchable_text,
+                query,
+                node_types,
+                limit,
+                token_index=self._token_index,
+            )
 
     def get_node(self, node_id: str) -> Optional[Node]:
         """Get a specific node"""
-        return self.nodes.get(node_id)
+        with self._lock:
+            return self.nodes.get(node_id)
+
+    def get_views_by_name(self, name: str) -> List[Node]:
+        """Return saved-view nodes whose name is exactly *name*."""
+        with self._lock:
+            return [
+                self.nodes[node_id]
+                for node_id in self._view_ids_by_name.get(name, ())
+                if node_id in self.nodes
+            ]
+
+    def get_nodes_by_type(self, type_name: str) -> List[Node]:
+        """Return all nodes of type *type_name*, in insertion order."""
+        with self._lock:
+            return [
+                self.nodes[node_id]
+                for node_id in self._node_ids_by_type.get(type_name, ())
+                if node_id in self.nodes
+            ]
 
     def get_all_nodes(self) -> List[Node]:
         """Get all nodes in the graph"""
-        return list(self.nodes.values())
+        with self._lock:
+            return list(self.nodes.values())
 
     def get_all_edges(self) -> List[Edge]:
         """Get all edges in the graph"""
-        return list(self.edges.values())
+        with self._lock:
+            return list(self.edges.values())
 
     def get_related_nodes(
         self,
@@ -525,9 +615,10 @@ class GraphStorage:
         depth: int = 1,
     ) -> Dict[str, Any]:
         """Get nodes connected to the given node.  Delegates to storage_search."""
-        return storage_search.get_related_nodes(
-            self.nodes, self.edges, self.graph, node_id, relationship_types, depth
-        )
+        with self._lock:
+            return storage_search.get_related_nodes(
+                self.nodes, self.edges, self.graph, node_id, relationship_types, depth
+            )
 
     def find_similar_nodes(
         self,
@@ -537,9 +628,16 @@ class GraphStorage:
         limit: int = 5,
     ) -> List[SimilarNode]:
         """Find similar nodes by name (Levenshtein + vector).  Delegates to storage_search."""
-        return storage_search.find_similar_nodes(
-            self.nodes, self.vector_store, name, node_type, threshold, limit
-        )
+        with self._lock:
+            return storage_search.find_similar_nodes(
+                self.nodes,
+                self.vector_store,
+                name,
+                node_type,
+                threshold,
+                limit,
+                names_lower=self._eligible_names_lower(node_type),
+            )
 
     def find_similar_nodes_batch(
         self,
@@ -549,9 +647,29 @@ class GraphStorage:
         limit: int = 5,
     ) -> Dict[str, List[SimilarNode]]:
         """Batch variant of find_similar_nodes.  Delegates to storage_search."""
-        return storage_search.find_similar_nodes_batch(
-            self.nodes, self.vector_store, names, node_type, threshold, limit
+        with self._lock:
+            return storage_search.find_similar_nodes_batch(
+                self.nodes,
+                self.vector_store,
+                names,
+                node_type,
+                threshold,
+                limit,
+                names_lower=self._eligible_names_lower(node_type),
+            )
+
+    def _eligible_names_lower(self, node_type: Optional[NodeType]) -> Dict[str, str]:
+        """Cached lowercased names, narrowed to *node_type*.
+
+        Untyped lookups get the live map itself, not a copy: callers must
+        hold ``self._lock`` while using it and treat it as read-only.
+        """
+        if not node_type:
+            return self._names_lower
+        type_ids = self._node_ids_by_type.get(
+            getattr(node_type, "value", str(node_type)), {}
         )
+        return {node_id: self._names_lower[node_id] for node_id in type_ids}
 
     def add_nodes(
         self,
@@ -587,14 +705,13 @@ class GraphStorage:
                         )
 
                     self.nodes[node.id] = node
+                    self._track_node(node, 1)
                     self.graph.add_node(node.id, data=node)
                     added_node_ids.append(node.id)
                     nodes_to_embed.append(node)
 
                     # Precompute searchable text
-                    self._searchable_text_cache[node.id] = self._build_searchable_text(
-                        node
-                    )
+                    self._cache_searchable_text(node)
 
                 # Generate embeddings for new nodes (non-blocking)
                 if nodes_to_embed:
@@ -746,9 +863,13 @@ class GraphStorage:
                 "metadata",
             }
             reserved_fields = {"id", "type", "embedding", "created_at", "updated_at"}
+            # Type is reserved, so only the name-keyed indexes can change
+            self._track_view_name(node, -1)
             for key, value in updates.items():
                 if key in allowed_fields:
                     setattr(node, key, value)
+            self._track_view_name(node, 1)
+            self._names_lower[node.id] = node.name.lower()
             # Fold schema-defined extra fields (anything outside the base model) into metadata
             extra = {
                 k: v
@@ -766,7 +887,7 @@ class GraphStorage:
             self.graph.nodes[node_id]["data"] = node
 
             # Update searchable text cache
-            self._searchable_text_cache[node.id] = self._build_searchable_text(node)
+            self._cache_searchable_text(node)
 
             # Update embedding if text fields or tags changed (non-blocking)
             if any(
@@ -866,7 +987,8 @@ class GraphStorage:
                     # Remove node
                     self.graph.remove_node(node_id)
                     del self.nodes[node_id]
-                    self._searchable_text_cache.pop(node_id, None)
+                    self._track_node(node, -1)
+                    self._uncache_searchable_text(node_id)
                     deleted_node_ids.append(node_id)
 
                 # Remove embeddings
@@ -918,17 +1040,17 @@ class GraphStorage:
 
     def get_stats(self) -> GraphStats:
         """Get statistics for the graph"""
-        # Count nodes per type
-        nodes_by_type = {}
-        for node in self.nodes.values():
-            type_name = (
-                node.type.value if hasattr(node.type, "value") else str(node.type)
-            )
-            nodes_by_type[type_name] = nodes_by_type.get(type_name, 0) + 1
+        with self._lock:
+            nodes_by_type = {
+                type_name: len(node_ids)
+                for type_name, node_ids in self._node_ids_by_type.items()
+            }
+            total_nodes = len(self.nodes)
+            total_edges = len(self.edges)
 
         return GraphStats(
-            total_nodes=len(self.nodes),
-            total_edges=len(self.edges),
+            total_nodes=total_nodes,
+            total_edges=total_edges,
             nodes_by_type=nodes_by_type,
             last_updated=datetime.now(timezone.utc),
         )
@@ -944,35 +1066,38 @@ class GraphStorage:
         Returns:
             Dict mapping node type names to sorted lists of unique subtypes.
         """
-        result: Dict[str, set] = {}
-        for node in self.nodes.values():
-            type_name = (
-                node.type.value if hasattr(node.type, "value") else str(node.type)
-            )
-            if node_type and type_name != node_type:
-                continue
-            if hasattr(node, "subtypes") and node.subtypes:
-                if type_name not in result:
-                    result[type_name] = set()
-                result[type_name].update(node.subtypes)
-        return {k: sorted(v) for k, v in result.items()}
+        with self._lock:
+            result: Dict[str, set] = {}
+            for node in self.nodes.values():
+                type_name = (
+                    node.type.value if hasattr(node.type, "value") else str(node.type)
+                )
+                if node_type and type_name != node_type:
+                    continue
+                if hasattr(node, "subtypes") and node.subtypes:
+                    if type_name not in result:
+                        result[type_name] = set()
+                    result[type_name].update(node.subtypes)
+            return {k: sorted(v) for k, v in result.items()}
 
     def get_edges_between_nodes(self, node_ids: List[str]) -> List[Edge]:
         """Get all edges where both source and target are in the given node IDs"""
-        node_id_set = set(node_ids)
-        return [
-            edge
-            for edge in self.edges.values()
-            if edge.source in node_id_set and edge.target in node_id_set
-        ]
+        with self._lock:
+            node_id_set = set(node_ids)
+            return [
+                edge
+                for edge in self.edges.values()
+                if edge.source in node_id_set and edge.target in node_id_set
+            ]
 
     def get_edges_for_node(self, node_id: str) -> List[Edge]:
         """Get all edges connected to a specific node"""
-        return [
-            edge
-            for edge in self.edges.values()
-            if edge.source == node_id or edge.target == node_id
-        ]
+        with self._lock:
+            return [
+                edge
+                for edge in self.edges.values()
+                if edge.source == node_id or edge.target == node_id
+            ]
 
     def update_edge(
         self,
@@ -1193,25 +1318,26 @@ class GraphStorage:
         Get all edges connected to any of the given nodes (incoming or outgoing).
         More efficient than iterating through all edges.
         """
-        collected_edges = {}
-
-        for node_id in node_ids:
-            if node_id not in self.nodes:
-                continue
-
-            if node_id in self.graph:
-                # Outgoing edges
-                for _, _, _, edge_data in self.graph.out_edges(
-                    node_id, keys=True, data=True
-                ):
-                    edge = edge_data["data"]
-                    collected_edges[edge.id] = edge
-
-                # Incoming edges
-                for _, _, _, edge_data in self.graph.in_edges(
-                    node_id, keys=True, data=True
-                ):
-                    edge = edge_data["data"]
-                    collected_edges[edge.id] = edge
-
-        return list(collected_edges.values())
+        with self._lock:
+            collected_edges = {}
+
+            for node_id in node_ids:
+                if node_id not in self.nodes:
+                    continue
+
+                if node_id in self.graph:
+                    # Outgoing edges
+                    for _, _, _, edge_data in self.graph.out_edges(
+                        node_id, keys=True, data=True
+                    ):
+                        edge = edge_data["data"]
+                        collected_edges[edge.id] = edge
+
+                    # Incoming edges
+                    for _, _, _, edge_data in self.graph.in_edges(
+                        node_id, keys=True, data=True
+                    ):
+                        edge = edge_data["data"]
+                        collected_edges[edge.id] = edge
+
+            return list(collected_edges.values())
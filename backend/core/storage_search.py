@@ -7,8 +7,10 @@ search/similarity/related methods here and passes ``self.nodes``,
 ``self.edges``, ``self.graph``, etc. as arguments.
 """
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
+import numpy as np
+from rapidfuzz import process
 from rapidfuzz.distance import Levenshtein
 
 from .models import Node, Edge, NodeType, RelationshipType, SimilarNode
@@ -33,6 +35,55 @@ def build_searchable_text(node: Node, type_searchable_text: Dict[str, str]) -> s
     return f"{node.name} {node.description} {node.summary} {tags_text} {subtypes_text} {aliases_text} {type_text}".lower()
 
 
+def text_tokens(text: str) -> Set[str]:
+    """Return the distinct whitespace-separated words of *text*."""
+    return set(text.split())
+
+
+def index_searchable_text(
+    token_index: Dict[str, Set[str]], node_id: str, text: str
+) -> None:
+    """Register *node_id* under every word of its searchable *text*."""
+    for token in text_tokens(text):
+        postings = token_index.get(token)
+        if postings is None:
+            token_index[token] = {node_id}
+        else:
+            postings.add(node_id)
+
+
+def unindex_searchable_text(
+    token_index: Dict[str, Set[str]], node_id: str, text: str
+) -> None:
+    """Remove *node_id* from the word postings of its previous *text*."""
+    for token in text_tokens(text):
+        postings = token_index.get(token)
+        if postings is not None:
+            postings.discard(node_id)
+            if not postings:
+                del token_index[token]
+
+
+def candidate_node_ids(token_index: Dict[str, Set[str]], query_lower: str) -> Set[str]:
+    """Node IDs whose searchable text may contain *query_lower*.
+
+    A substring without whitespace can only occur inside a single word, so
+    scanning the (much smaller) vocabulary finds every node that contains it.
+    Multi-word queries intersect the candidates of each word; callers confirm
+    the candidates with a substring test.
+    """
+    candidates: Optional[Set[str]] = None
+    for piece in sorted(set(query_lower.split()), key=len, reverse=True):
+        matches: Set[str] = set()
+        for token, postings in token_index.items():
+            if piece in token:
+                matches.update(postings)
+        candidates = matches if candidates is None else candidates & matches
+        if not candidates:
+            return set()
+    return candidates or set()
+
+
 def score_node_match(
     node: Node, query_lower: str, type_searchable_text: Dict[str, str]
 ) -> int:
@@ -111,18 +162,38 @@ def search_nodes(
     query: str,
     node_types: Optional[List[NodeType]] = None,
     limit: int = 50,
+    token_index: Optional[Dict[str, Set[str]]] = None,
 ) -> List[Node]:
     """Text search over *nodes*.  Matches against name, description, summary,
     tags, subtypes, aliases and node type (including localized labels).
     Results are ranked so that name matches rank above type matches, which
     rank above description/tag matches.
     Empty query or ``'*'`` returns all nodes (subject to filtering and limit).
+
+    When *token_index* covers every node, queries of three or more
+    characters only substring-test the nodes holding a word that contains
+    each query word.
     """
     query_lower = query.lower().strip()
     results = []
     match_all = query_lower == "" or query_lower == "*"
 
-    for node in nodes.values():
+    candidates = None
+    if (
+        not match_all
+        and token_index is not None
+        and len(query_lower) >= 3
+        and len(searchable_text_cache) == len(nodes)
+    ):
+        candidates = candidate_node_ids(token_index, query_lower)
+        if not candidates:
+            return []
+
+    # Narrow to the candidates in graph order (keeps tie order stable); the
+    # membership test runs inside filter() rather than per-node bytecode
+    node_ids = nodes if candidates is None else filter(candidates.__contains__, nodes)
+    for node_id in node_ids:
+        node = nodes[node_id]
         if node_types and node.type not in node_types:
             continue
 
@@ -131,11 +202,16 @@ def search_nodes(
             if searchable_text is None:
                 searchable_text = build_searchable_text(node, type_searchable_text)
                 searchable_text_cache[node.id] = searchable_text
+                if token_index is not None:
+                    index_searchable_text(token_index, node.id, searchable_text)
 
             if query_lower not in searchable_text:
                 continue
 
         results.append(node)
+        # Match-all results are unranked, so stop once the page is full
+        if match_all and 0 < limit <= len(results):
+            break
 
     if not match_all:
         results.sort(
@@ -165,36 +241,38 @@ def get_related_nodes(
     if node_id not in nodes:
         return {"nodes": [], "edges": []}
 
+    allowed_types = (
+        {getattr(t, "value", t) for t in relationship_types}
+        if relationship_types
+        else None
+    )
     visited_nodes = {node_id}
     visited_edges: set = set()
-    current_layer = {node_id}
+    current_layer = [node_id]
 
+    # Walk the successor/predecessor adjacency views
+    # ({neighbor: {edge_key: attrs}}) directly; out_edges/in_edges cost
+    # several wrapper calls per edge
+    succ, pred = graph.succ, graph.pred
     for _ in range(depth):
-        next_layer: set = set()
+        next_layer = []
 
         for curr_id in current_layer:
-            for _, target, edge_id, edge_data in graph.out_edges(
-                curr_id, keys=True, data=True
-            ):
-                edge = edge_data["data"]
-                if relationship_types and edge.type not in relationship_types:
-                    continue
-                visited_edges.add(edge_id)
-                if target not in visited_nodes:
-                    visited_nodes.add(target)
-                    next_layer.add(target)
-
-            for source, _, edge_id, edge_data in graph.in_edges(
-                curr_id, keys=True, data=True
-            ):
-                edge = edge_data["data"]
-                if relationship_types and edge.type not in relationship_types:
-                    continue
-                visited_edges.add(edge_id)
-                if source not in visited_nodes:
-                    visited_nodes.add(source)
-                    next_layer.add(source)
-
+            for adjacency in (succ[curr_id], pred[curr_id]):
+                for neighbor, keyed_edges in adjacency.items():
+                    for edge_id, edge_data in keyed_edges.items():
+                        if (
+                            allowed_types is not None
+                            and edge_data["data"].type_str not in allowed_types
+                        ):
+                            continue
+                        visited_edges.add(edge_id)
+                        if neighbor not in visited_nodes:
+                            visited_nodes.add(neighbor)
+                            next_layer.append(neighbor)
+
+        if not next_layer:
+            break
         current_layer = next_layer
 
     return {
@@ -207,6 +285,9 @@ def get_related_nodes(
 # Similarity
 # ---------------------------------------------------------------------------
 
+# Upper bound on query x name scores held in memory per cdist call
+_CDIST_MAX_CELLS = 1_000_000
+
 
 def find_similar_nodes(
     nodes: Dict[str, Node],
@@ -215,32 +296,101 @@ def find_similar_nodes(
     node_type: Optional[NodeType] = None,
     threshold: float = 0.7,
     limit: int = 5,
+    names_lower: Optional[Dict[str, str]] = None,
 ) -> List[SimilarNode]:
     """Find similar nodes using Levenshtein distance AND vector embeddings.
     Used for duplicate detection.
+
+    *names_lower* maps the eligible node IDs to their lowercased names, in
+    graph order; it is derived from *nodes* when not given.
+    """
+    if names_lower is None:
+        names_lower = _lowercase_names(nodes, node_type)
+    # Normalized Levenshtein similarity (1 - distance / longer length),
+    # scored and cut off in rapidfuzz's C++ loop; hits come back in graph order
+    name_hits = (
+        (node_id, similarity)
+        for _, similarity, node_id in process.extract_iter(
+            name.lower(),
+            names_lower,
+            scorer=Levenshtein.normalized_similarity,
+            score_cutoff=threshold,
+        )
+    )
+    return _find_similar_nodes(
+        nodes,
+        name_hits,
+        vector_store,
+        name,
+        node_type,
+        threshold,
+        limit,
+    )
+
+
+def _lowercase_names(
+    nodes: Dict[str, Node], node_type: Optional[NodeType]
+) -> Dict[str, str]:
+    """Lowercased names of the nodes eligible for name matching, in graph order."""
+    return {
+        node_id: node.name.lower()
+        for node_id, node in nodes.items()
+        if not node_type or node.type == node_type
+    }
+
+
+def _batch_name_hits(
+    names_lower: Dict[str, str], queries: List[str], threshold: float
+) -> Dict[str, List[Tuple[str, float]]]:
+    """Name-similarity hits for each query, in graph order.
+
+    Scores every query against every eligible name with one
+    ``process.cdist`` call per chunk of queries instead of one
+    ``extract_iter`` pass per query; the chunking keeps the score matrix
+    bounded on large graphs.
     """
+    node_ids = list(names_lower)
+    if not node_ids:
+        return {query: [] for query in queries}
+    choices = list(names_lower.values())
+    rows_per_chunk = max(1, _CDIST_MAX_CELLS // len(choices))
+    hits: Dict[str, List[Tuple[str, float]]] = {}
+    for start in range(0, len(queries), rows_per_chunk):
+        chunk = queries[start : start + rows_per_chunk]
+        scores = process.cdist(
+            [query.lower() for query in chunk],
+            choices,
+            scorer=Levenshtein.normalized_similarity,
+            score_cutoff=threshold,
+            dtype=np.float64,
+        )
+        for query, row in zip(chunk, scores):
+            matched = np.flatnonzero(row >= threshold).tolist()
+            hits[query] = [(node_ids[i], float(row[i])) for i in matched]
+    return hits
+
+
+def _find_similar_nodes(
+    nodes: Dict[str, Node],
+    name_hits: Iterable[Tuple[str, float]],
+    vector_store: VectorStore,
+    name: str,
+    node_type: Optional[NodeType],
+    threshold: float,
+    limit: int,
+) -> List[SimilarNode]:
     results = []
     seen_node_ids: set = set()
 
-    name_lower = name.lower()
-    for node in nodes.values():
-        if node_type and node.type != node_type:
-            continue
-
-        node_name_lower = node.name.lower()
-        distance = Levenshtein.distance(name_lower, node_name_lower)
-        max_len = max(len(name_lower), len(node_name_lower))
-        similarity = 1.0 if max_len == 0 else 1.0 - (distance / max_len)
-
-        if similarity >= threshold:
-            results.append(
-                SimilarNode(
-                    node=node,
-                    similarity_score=round(similarity, 2),
-                    match_reason=f"Name similarity: {int(similarity * 100)}%",
-                )
+    for node_id, similarity in name_hits:
+        results.append(
+            SimilarNode(
+                node=nodes[node_id],
+                similarity_score=round(similarity, 2),
+                match_reason=f"Name similarity: {int(similarity * 100)}%",
             )
-            seen_node_ids.add(node.id)
+        )
+        seen_node_ids.add(node_id)
 
     vector_threshold = max(0.4, threshold - 0.2)
     vector_results = vector_store.search(
@@ -275,18 +425,18 @@ def find_similar_nodes_batch(
     node_type: Optional[NodeType] = None,
     threshold: float = 0.7,
     limit: int = 5,
+    names_lower: Optional[Dict[str, str]] = None,
 ) -> Dict[str, List[SimilarNode]]:
     """Batch variant of :func:`find_similar_nodes`.  More efficient than
     calling it repeatedly when many names need to be checked at once.
     """
+    if names_lower is None:
+        names_lower = _lowercase_names(nodes, node_type)
+    queries = list(dict.fromkeys(names))
+    name_hits = _batch_name_hits(names_lower, queries, threshold)
     return {
-        name: find_similar_nodes(
-            nodes,
-            vector_store,
-            name,
-            node_type=node_type,
-            threshold=threshold,
-            limit=limit,
+        name: _find_similar_nodes(
+            nodes, name_hits[name], vector_store, name, node_type, threshold, limit
         )
-        for name in names
+        for name in queries
     }
@@ -2,6 +2,7 @@
 Unit tests for graph_core models
 """
 
+import json
 import pytest
 from datetime import datetime, timezone
 import uuid
@@ -264,6 +265,41 @@ class TestNode:
         uuid.UUID(node1.id)
         uuid.UUID(node2.id)
 
+    def test_node_type_strings_map_to_enum_or_pass_through(self):
+        """Built-in type strings become NodeType members; others stay strings"""
+        assert Node(type="Actor", name="A").type is NodeType.ACTOR
+        custom = Node(type="Widget", name="W")
+        assert custom.type == "Widget"
+        assert not isinstance(custom.type, NodeType)
+
+    def test_node_repeated_strings_are_interned(self):
+        """Type strings, tags and subtypes decoded separately share one object"""
+        first, second = (
+            Node.from_dict(
+                json.loads(
+                    '{"type": "Widget", "name": "N", "tags": ["digital"],'
+                    ' "subtypes": ["agency"]}'
+                )
+            )
+            for _ in range(2)
+        )
+        assert first.type is second.type
+        assert first.tags[0] is second.tags[0]
+        assert first.subtypes[0] is second.subtypes[0]
+
+    def test_node_json_cache_is_keyed_by_revision_and_exclude(self):
+        """Cached JSON follows assignments and never crosses exclude sets"""
+        node = Node(type=NodeType.ACTOR, name="Agency", embedding=[0.5])
+
+        full = json.loads(node.to_json_cached())
+        trimmed = json.loads(node.to_json_cached({"embedding"}))
+        assert full["embedding"] == [0.5]
+        assert "embedding" not in trimmed
+        assert json.loads(node.to_json_cached())["embedding"] == [0.5]
+
+        node.name = "Renamed"
+        assert json.loads(node.to_json_cached({"embedding"}))["name"] == "Renamed"
+
 
 class TestEdge:
     """Tests for Edge model"""
@@ -310,6 +346,17 @@ class TestEdge:
         assert edge.id == "edge-1"
         assert edge.type == RelationshipType.RELATES_TO
 
+    def test_edge_type_strings_map_to_enum_or_pass_through(self):
+        """Built-in relationship strings become enum members; others stay strings"""
+        assert (
+            Edge(source="a", target="b", type="PART_OF").type
+            is RelationshipType.PART_OF
+        )
+        custom = Edge(source="a", target="b", type="MENTORS")
+        assert custom.type == "MENTORS"
+        assert not isinstance(custom.type, RelationshipType)
+        assert Edge(source="a", target="b", type="").type is RelationshipType.RELATES_TO
+
     def test_edge_from_dict_accepts_zulu_timestamp(self):
         """Test creating edge from dictionary with UTC Z suffix timestamp."""
         data = {
@@ -6,6 +6,7 @@ import pytest
 import tempfile
 import os
 import json
+from unittest.mock import patch
 
 from backend.core import (
     FileGraphPersistenceBackend,
@@ -15,6 +16,7 @@ from backend.core import (
     NodeType,
     RelationshipType,
 )
+from backend.core import storage_search
 
 
 @pytest.fixture
@@ -312,6 +314,18 @@ class TestGraphStorageSearch:
         results = storage_with_data.search_nodes("", limit=2)
         assert len(results) <= 2
 
+    def test_search_match_all_limit_keeps_insertion_order(self, storage_with_data):
+        """Match-all queries return the first matching nodes in insertion order."""
+        all_nodes = storage_with_data.get_all_nodes()
+        first_two = [n.id for n in storage_with_data.search_nodes("*", limit=2)]
+        assert first_two == [n.id for n in all_nodes[:2]]
+
+        actors = [n.id for n in all_nodes if n.type == NodeType.ACTOR]
+        results = storage_with_data.search_nodes(
+            "", node_types=[NodeType.ACTOR], limit=1
+        )
+        assert [n.id for n in results] == actors[:1]
+
     def test_search_case_insensitive(self, storage_with_data):
         """Test that search is case-insensitive"""
         results1 = storage_with_data.search_nodes("TEST ACTOR")
@@ -347,6 +361,66 @@ class TestGraphStorageSearch:
         assert temp_storage.nodes["ec"].aliases == ["EC"]
         assert any(n.id == "ec" for n in temp_storage.search_nodes("EC"))
 
+    def test_search_index_matches_full_scan(self, storage_with_data):
+        """Word-indexed search returns the same nodes as a plain scan."""
+        storage_with_data.update_node("actor-2", {"description": "Renamed agency"})
+        storage_with_data.delete_nodes(["theme-1"], confirmed=True)
+
+        for query in [
+            "agency",
+            "gency",
+            "test act",
+            "st actor 1",
+            "initiative",
+            "esam",
+            "zzz",
+        ]:
+            indexed = storage_with_data.search_nodes(query)
+            scanned = storage_search.search_nodes(
+                storage_with_data.nodes,
+                storage_with_data._searchable_text_cache,
+                storage_with_data._type_searchable_text,
+                query,
+            )
+            assert [n.id for n in indexed] == [n.id for n in scanned], query
+
+        assert storage_with_data.search_nodes("second test actor") == []
+        assert not any(
+            "theme-1" in ids for ids in storage_with_data._token_index.values()
+        )
+
+    def test_search_index_holds_one_posting_per_distinct_word(self, storage_with_data):
+        """Index size is bounded by the distinct words of each node's text."""
+        storage_with_data.update_node(
+            "init-1", {"description": "shared shared shared words " * 50}
+        )
+        storage_with_data.search_nodes("shared")
+
+        postings = sum(len(ids) for ids in storage_with_data._token_index.values())
+        assert postings == sum(
+            len(set(text.split()))
+            for text in storage_with_data._searchable_text_cache.values()
+        )
+
+    def test_search_index_built_at_load_then_maintained(self, storage_with_data):
+        """The word index is complete before any search and follows writes."""
+        assert "esam" in storage_with_data._token_index
+
+        storage_with_data.update_node("actor-1", {"name": "Relabelled body"})
+        storage_with_data.delete_nodes(["theme-1"], confirmed=True)
+
+        assert [n.id for n in storage_with_data.search_nodes("relabelled")] == [
+            "actor-1"
+        ]
+        assert not any(
+            "theme-1" in ids for ids in storage_with_data._token_index.values()
+        )
+
+        storage_with_data.flush()
+        storage_with_data.reload()
+        assert storage_with_data._token_index["relabelled"] == {"actor-1"}
+        assert "esam" not in storage_with_data._token_index
+
 
 class TestSearchRanking:
     """Tests for search result ranking/prioritization."""
@@ -647,6 +721,37 @@ class TestGraphStorageRelated:
         edge_types = [e.type for e in result["edges"]]
         assert all(t == RelationshipType.BELONGS_TO for t in edge_types)
 
+    def test_get_related_nodes_follows_incoming_and_parallel_edges(
+        self, storage_with_data
+    ):
+        """Traversal walks both directions and keeps every parallel edge."""
+        storage_with_data.add_nodes(
+            [],
+            [
+                Edge(
+                    id="edge-parallel",
+                    source="actor-2",
+                    target="init-1",
+                    type="RELATES_TO",
+                )
+            ],
+        )
+
+        result = storage_with_data.get_related_nodes(
+            "init-1", relationship_types=[RelationshipType.RELATES_TO], depth=2
+        )
+
+        assert {n.id for n in result["nodes"]} == {"init-1", "actor-2"}
+        assert {e.id for e in result["edges"]} == {"edge-2", "edge-parallel"}
+
+        unfiltered = storage_with_data.get_related_nodes("init-1", depth=1)
+        assert {n.id for n in unfiltered["nodes"]} == {
+            "init-1",
+            "actor-1",
+            "actor-2",
+            "theme-1",
+        }
+
     def test_get_related_nodes_not_found(self, storage_with_data):
         """Test getting related nodes for non-existent node"""
         result = storage_with_data.get_related_nodes("nonexistent")
@@ -692,6 +797,85 @@ class TestGraphStorageSimilarity:
         for r in results:
             assert 0.0 <= r.similarity_score <= 1.0
 
+    def test_find_similar_name_scores_and_tie_order(self, temp_storage):
+        """Name similarity is 1 - edit distance / longer length; ties keep graph order"""
+        temp_storage.add_nodes(
+            [
+                Node(id="n1", type=NodeType.ACTOR, name="Agency X"),
+                Node(id="n2", type=NodeType.ACTOR, name="agency y"),
+                Node(id="n3", type=NodeType.ACTOR, name="Agency"),
+                Node(id="n4", type=NodeType.GOAL, name="Unrelated goal"),
+            ],
+            [],
+        )
+        with patch.object(temp_storage.vector_store, "search", return_value=[]):
+            results = temp_storage.find_similar_nodes("agency z", threshold=0.7)
+            batch = temp_storage.find_similar_nodes_batch(["agency z"], threshold=0.7)
+
+        # 1 substitution over 8 chars -> 0.875 for both; "Agency" is 2 short -> 0.75
+        assert [(r.node.id, r.similarity_score) for r in results] == [
+            ("n1", 0.88),
+            ("n2", 0.88),
+            ("n3", 0.75),
+        ]
+        assert [r.node.id for r in batch["agency z"]] == ["n1", "n2", "n3"]
+
+    def test_find_similar_batch_matches_single_lookups(self, temp_storage):
+        """Batch scoring gives the same hits as per-name calls, across chunks"""
+        temp_storage.add_nodes(
+            [
+                Node(id="n1", type=NodeType.ACTOR, name="Agency X"),
+                Node(id="n2", type=NodeType.ACTOR, name="Agency Y"),
+                Node(id="n3", type=NodeType.GOAL, name="Open Data"),
+            ],
+            [],
+        )
+        names = ["agency z", "OPEN DATA", "nothing alike", "agency z"]
+
+        with (
+            patch.object(temp_storage.vector_store, "search", return_value=[]),
+            patch.object(storage_search, "_CDIST_MAX_CELLS", 3),
+        ):
+            batch = temp_storage.find_similar_nodes_batch(names, threshold=0.6)
+            singles = {
+                name: temp_storage.find_similar_nodes(name, threshold=0.6)
+                for name in names
+            }
+
+        assert list(batch) == ["agency z", "OPEN DATA", "nothing alike"]
+        for name, results in batch.items():
+            assert [(r.node.id, r.similarity_score) for r in results] == [
+                (r.node.id, r.similarity_score) for r in singles[name]
+            ]
+        assert [r.node.id for r in batch["OPEN DATA"]] == ["n3"]
+        assert batch["nothing alike"] == []
+
+    def test_find_similar_tracks_renames_and_deletes(self, temp_storage):
+        """Cached lowercased names follow updates, deletions and the type filter"""
+        temp_storage.add_nodes(
+            [
+                Node(id="a1", type=NodeType.ACTOR, name="Old Name"),
+                Node(id="a2", type=NodeType.ACTOR, name="Doomed Agency"),
+                Node(id="g1", type=NodeType.GOAL, name="Fresh Label"),
+            ],
+            [],
+        )
+        temp_storage.update_node("a1", {"name": "Fresh Label"})
+        temp_storage.delete_nodes(["a2"], confirmed=True)
+
+        with patch.object(temp_storage.vector_store, "search", return_value=[]):
+            assert [
+                r.node.id for r in temp_storage.find_similar_nodes("fresh label")
+            ] == ["a1", "g1"]
+            assert [
+                r.node.id
+                for r in temp_storage.find_similar_nodes(
+                    "fresh label", node_type=NodeType.ACTOR
+                )
+            ] == ["a1"]
+            assert temp_storage.find_similar_nodes("old name") == []
+            assert temp_storage.find_similar_nodes("doomed agency") == []
+
 
 class TestGraphStorageStats:
     """Tests for statistics"""
@@ -712,6 +896,57 @@ class TestGraphStorageStats:
         assert "Theme" in stats.nodes_by_type
         assert stats.nodes_by_type["Theme"] == 1
 
+    def test_get_views_by_name_tracks_mutations(self, temp_storage):
+        """View lookup by name follows renames, deletes and reloads"""
+        temp_storage.add_nodes(
+            [
+                Node(id="view-1", type=NodeType.SAVED_VIEW, name="Overview"),
+                Node(id="actor-1", type=NodeType.ACTOR, name="Overview"),
+            ],
+            [],
+        )
+        assert [n.id for n in temp_storage.get_views_by_name("Overview")] == ["view-1"]
+
+        temp_storage.update_node("view-1", {"name": "Renamed"})
+        assert temp_storage.get_views_by_name("Overview") == []
+        assert [n.id for n in temp_storage.get_views_by_name("Renamed")] == ["view-1"]
+
+        temp_storage.flush()
+        temp_storage.reload()
+        assert [n.id for n in temp_storage.get_views_by_name("Renamed")] == ["view-1"]
+
+        temp_storage.delete_nodes(["view-1"], confirmed=True)
+        assert temp_storage.get_views_by_name("Renamed") == []
+
+    def test_get_stats_tracks_deletes_and_reload(self, storage_with_data):
+        """Type counts follow deletions and are rebuilt on reload"""
+        storage_with_data.delete_nodes(["actor-1", "theme-1"], confirmed=True)
+
+        stats = storage_with_data.get_stats()
+        assert stats.total_nodes == 2
+        assert stats.nodes_by_type == {"Actor": 1, "Initiative": 1}
+
+        storage_with_data.flush()
+        storage_with_data.reload()
+        assert storage_with_data.get_stats().nodes_by_type == stats.nodes_by_type
+
+    def test_get_nodes_by_type_follows_mutations(self, temp_storage):
+        """Per-type lookups keep insertion order through updates and deletes"""
+        temp_storage.add_nodes(
+            [
+                Node(id="a1", type=NodeType.ACTOR, name="First"),
+                Node(id="i1", type=NodeType.INITIATIVE, name="Project"),
+                Node(id="a2", type=NodeType.ACTOR, name="Second"),
+            ],
+            [],
+        )
+        temp_storage.update_node("a1", {"name": "First renamed"})
+        assert [n.id for n in temp_storage.get_nodes_by_type("Actor")] == ["a1", "a2"]
+
+        temp_storage.delete_nodes(["a1"], confirmed=True)
+        assert [n.id for n in temp_storage.get_nodes_by_type("Actor")] == ["a2"]
+        assert temp_storage.get_nodes_by_type("Goal") == []
+
 
 class TestGraphStorageSubtypes:
     """Tests for subtypes functionality"""
@@ -864,6 +1099,28 @@ class TestGraphStoragePersistence:
         assert {"persist-backend-1", "persist-backend-2"}.issubset(persisted_ids)
         assert backend.data["metadata"]["graph_name"] == "in-memory-graph"
 
+    def test_save_persists_updates_to_cached_node_dicts(self):
+        """Updated nodes must be re-serialized even though unchanged ones are reused."""
+        backend = InMemoryPersistenceBackend()
+        storage = GraphStorage(persistence_backend=backend)
+        storage.add_nodes(
+            [
+                Node(id="cached-1", type=NodeType.ACTOR, name="Before"),
+                Node(id="cached-2", type=NodeType.ACTOR, name="Untouched"),
+            ],
+            [],
+        )
+        storage.flush()
+        untouched = storage.get_node("cached-2")
+        first_dict = untouched.to_dict_cached()
+
+        storage.update_node("cached-1", {"name": "After"})
+        storage.flush()
+
+        names = {node["id"]: node["name"] for node in backend.data["nodes"]}
+        assert names == {"cached-1": "After", "cached-2": "Untouched"}
+        assert untouched.to_dict_cached() is first_dict
+
     def test_save_and_reload(self, temp_storage):
         """Test that data persists across storage instances"""
         # Add data
@@ -884,6 +1141,22 @@ class TestGraphStoragePersistence:
         assert loaded_node is not None
         assert loaded_node.name == "Persistent Node"
 
+    def test_file_backend_writes_one_line_per_node_and_edge(self, tmp_path):
+        """The graph file round-trips and keeps each node/edge on its own line."""
+        backend = FileGraphPersistenceBackend(tmp_path / "graph.json")
+        data = {
+            "nodes": [{"id": "n1", "name": "Åkerbruk"}, {"id": "n2", "name": "B"}],
+            "edges": [],
+            "metadata": {"version": "1.0"},
+        }
+
+        backend.save_graph_data(data)
+
+        assert backend.load_graph_data() == data
+        lines = backend.json_path.read_text(encoding="utf-8").splitlines()
+        assert '    {"id": "n1", "name": "Åkerbruk"},' in lines
+        assert '    {"id": "n2", "name": "B"}' in lines
+
     def test_json_format(self, storage_with_data):
         """Test that JSON file has correct format"""
         with open(storage_with_data.json_path, "r") as f:
@@ -1130,6 +1403,49 @@ class TestGraphStorageConcurrency:
             "Graph is corrupted after concurrent operations"
         )
 
+    def test_get_related_nodes_waits_for_writers(self, storage_with_data):
+        """The BFS runs under the storage lock, so it never sees a mid-write graph"""
+        import threading
+
+        result = {}
+
+        def traverse():
+            result["related"] = storage_with_data.get_related_nodes("init-1")
+
+        with storage_with_data._lock:
+            reader = threading.Thread(target=traverse)
+            reader.start()
+            reader.join(timeout=0.2)
+            assert reader.is_alive(), "traversal ran while a writer held the lock"
+
+        reader.join(timeout=5)
+        assert len(result["related"]["edges"]) == 3
+
+    @pytest.mark.parametrize(
+        "read",
+        [
+            lambda s: s.get_node("actor-1"),
+            lambda s: s.get_all_nodes(),
+            lambda s: s.get_all_edges(),
+            lambda s: s.get_edges_for_node("init-1"),
+            lambda s: s.get_incident_edges(["init-1"]),
+            lambda s: s.find_similar_nodes("Test Actor"),
+            lambda s: s.find_similar_nodes_batch(["Test Actor"]),
+        ],
+    )
+    def test_reads_wait_for_writers(self, storage_with_data, read):
+        """Reads offloaded to worker threads never overlap a locked write"""
+        import threading
+
+        with storage_with_data._lock:
+            reader = threading.Thread(target=read, args=(storage_with_data,))
+            reader.start()
+            reader.join(timeout=0.2)
+            assert reader.is_alive(), "read ran while a writer held the lock"
+
+        reader.join(timeout=5)
+        assert not reader.is_alive()
+
     def test_atomic_save_prevents_corruption(self, temp_storage):
         """
         Test that the atomic save mechanism prevents file corruption.
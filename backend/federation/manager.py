@@ -420,37 +420,41 @@ class FederationManager:
     def _sync_loop(self) -> None:
         loop = asyncio.new_event_loop()
         asyncio.set_event_loop(loop)
+        # One client for the scheduler's lifetime so periodic syncs reuse
+        # pooled keep-alive connections instead of reconnecting every tick.
+        client = httpx.AsyncClient()
 
         async def _run_sync(graphs_to_sync):
-            async with httpx.AsyncClient() as client:
-                coros = [self.sync_graph(g_id, client) for g_id in graphs_to_sync]
-                await asyncio.gather(*coros)
-
-        while not self._stop_event.wait(1.0):
-            now = time.monotonic()
-            graphs_to_sync = []
-
-            for graph in self._config.federation.graphs:
-                if not graph.enabled or graph.sync.mode != "scheduled":
-                    continue
+            coros = [self.sync_graph(g_id, client) for g_id in graphs_to_sync]
+            await asyncio.gather(*coros)
 
-                next_at = self._next_sync_at.get(graph.graph_id)
-                if next_at is None:
-                    self._next_sync_at[graph.graph_id] = (
-                        now + graph.sync.interval_seconds
-                    )
-                    continue
+        try:
+            while not self._stop_event.wait(1.0):
+                now = time.monotonic()
+                graphs_to_sync = []
 
-                if now >= next_at:
-                    graphs_to_sync.append(graph.graph_id)
-                    self._next_sync_at[graph.graph_id] = (
-                        now + graph.sync.interval_seconds
-                    )
+                for graph in self._config.federation.graphs:
+                    if not graph.enabled or graph.sync.mode != "scheduled":
+                        continue
 
-            if graphs_to_sync:
-                loop.run_until_complete(_run_sync(graphs_to_sync))
+                    next_at = self._next_sync_at.get(graph.graph_id)
+                    if next_at is None:
+                        self._next_sync_at[graph.graph_id] = (
+                            now + graph.sync.interval_seconds
+                        )
+                        continue
 
-        loop.close()
+                    if now >= next_at:
+                        graphs_to_sync.append(graph.graph_id)
+                        self._next_sync_at[graph.graph_id] = (
+                            now + graph.sync.interval_seconds
+                        )
+
+                if graphs_to_sync:
+                    loop.run_until_complete(_run_sync(graphs_to_sync))
+        finally:
+            loop.run_until_complete(client.aclose())
+            loop.close()
 
     def _emit_node_events(
         self, previous_nodes: Dict[str, Node], current_nodes: Dict[str, Node]
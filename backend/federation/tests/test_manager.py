@@ -2,11 +2,16 @@
 
 import json
 import threading
+import time
+from unittest.mock import patch
+
+import httpx2 as httpx
 import pytest
 from http.server import BaseHTTPRequestHandler, HTTPServer
 
 from backend.core.models import Node, NodeType
 from backend.federation.config import FederationFileConfig
+from backend.federation import manager as manager_module
 from backend.federation.manager import FederationManager
 
 
@@ -191,6 +196,65 @@ def test_scheduler_starts_for_scheduled_graph():
         manager.stop()
 
 
+def test_scheduler_reuses_one_http_client_across_syncs():
+    server = _start_server()
+    port = server.server_address[1]
+    config = FederationFileConfig.model_validate(
+        {
+            "federation": {
+                "enabled": True,
+                "graphs": [
+                    {
+                        "graph_id": "sched",
+                        "display_name": "Scheduled",
+                        "enabled": True,
+                        "sync": {"mode": "scheduled", "on_startup": False},
+                        "endpoints": {
+                            "graph_json_url": f"http://127.0.0.1:{port}/graph.json"
+                        },
+                    }
+                ],
+            }
+        }
+    )
+    clients = []
+    real_client = httpx.AsyncClient
+
+    def _tracking_client(*args, **kwargs):
+        client = real_client(*args, **kwargs)
+        clients.append(client)
+        return client
+
+    manager = FederationManager(config)
+    synced = []
+    original_sync_graph = manager.sync_graph
+
+    async def _counting_sync(graph_id, client=None):
+        result = await original_sync_graph(graph_id, client)
+        synced.append(result["success"])
+        return result
+
+    manager.sync_graph = _counting_sync
+    try:
+        with patch.object(manager_module.httpx, "AsyncClient", _tracking_client):
+            manager.start()
+            for _ in range(2):
+                # Make the next scheduler tick due immediately
+                expected = len(synced) + 1
+                manager._next_sync_at["sched"] = 0.0
+                deadline = time.monotonic() + 5
+                while len(synced) < expected and time.monotonic() < deadline:
+                    time.sleep(0.05)
+            manager.stop()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert synced == [True, True]
+    assert len(clients) == 1
+    assert clients[0].is_closed
+
+
 def test_sync_emits_node_events_for_cache_changes():
     events = []
 
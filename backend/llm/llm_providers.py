@@ -8,6 +8,9 @@ from typing import Any, Dict, List, Optional
 import json
 import os
 
+# Anthropic prompt-caching marker for content that repeats across requests
+_EPHEMERAL = {"type": "ephemeral"}
+
 
 class LLMProvider(ABC):
     """Abstract base class for LLM providers"""
@@ -58,8 +61,8 @@ class ClaudeProvider(LLMProvider):
         response = self.client.messages.create(
             model=self.model,
             max_tokens=max_tokens,
-            system=system_prompt,
-            tools=tools,
+            system=self._cached_system(system_prompt),
+            tools=self._cached_tools(tools),
             messages=messages,
         )
 
@@ -86,6 +89,28 @@ class ClaudeProvider(LLMProvider):
         """Claude uses the tool definitions as-is"""
         return tools
 
+    @staticmethod
+    def _cached_system(system_prompt: str) -> Any:
+        """Wrap the system prompt in a text block marked for prompt caching.
+
+        The tool list and system prompt are resent unchanged on every turn of
+        a tool-use loop, so caching them saves re-processing those tokens.
+        """
+        if not system_prompt:
+            return system_prompt
+        return [{"type": "text", "text": system_prompt, "cache_control": _EPHEMERAL}]
+
+    @staticmethod
+    def _cached_tools(tools: List[Dict]) -> List[Dict]:
+        """Mark the last tool definition as a cache breakpoint.
+
+        The caller's definitions are left untouched; only the last entry is
+        copied so the shared tool list is never mutated.
+        """
+        if not tools:
+            return tools
+        return [*tools[:-1], {**tools[-1], "cache_control": _EPHEMERAL}]
+
 
 class OpenAIProvider(LLMProvider):
     """OpenAI provider — also works with any OpenAI-compatible API (Ollama, vLLM, Azure OpenAI, etc.)"""
@@ -114,18 +114,22 @@ def filter_nodes_and_edges(
 def get_visible_local_graph_stats(
     storage: "GraphStorage", graph_access: GraphAccessNarrowing
 ) -> GraphStats:
-    visible_nodes, visible_edges = filter_nodes_and_edges(
-        nodes=storage.get_all_nodes(),
-        edges=storage.get_all_edges(),
-        graph_access=graph_access,
-    )
-    nodes_by_type = Counter(
-        node.type.value if hasattr(node.type, "value") else str(node.type)
-        for node in visible_nodes
+    # Single pass over the nodes: visibility, per-type counts and the ID set
+    # used to count edges, without materializing the filtered lists
+    nodes_by_type: Counter = Counter()
+    visible_node_ids = set()
+    for node in storage.get_all_nodes():
+        if is_node_visible(node, graph_access):
+            nodes_by_type[node.type_str] += 1
+            visible_node_ids.add(node.id)
+    total_edges = sum(
+        1
+        for e in storage.get_all_edges()
+        if e.source in visible_node_ids and e.target in visible_node_ids
     )
     return GraphStats(
-        total_nodes=len(visible_nodes),
-        total_edges=len(visible_edges),
+        total_nodes=len(visible_node_ids),
+        total_edges=total_edges,
         nodes_by_type=dict(nodes_by_type),
         last_updated=datetime.now(timezone.utc),
     )
@@ -7,6 +7,8 @@ and (where required) the federation manager as explicit parameters.
 
 from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
+from pydantic import TypeAdapter, ValidationError
+
 from backend.core import Edge, Node
 from backend.runtime.authorization import (
     GRAPH_ACTION_MUTATE,
@@ -49,6 +51,11 @@ _NODE_MODEL_FIELDS = {
     "updated_at",
 }
 
+# Compiled once: validating whole lists in one pydantic-core call is cheaper
+# than constructing each model individually.
+_NODES_ADAPTER = TypeAdapter(List[Node])
+_EDGES_ADAPTER = TypeAdapter(List[Edge])
+
 
 def add_nodes(
     storage: "GraphStorage",
@@ -69,7 +76,7 @@ def add_nodes(
 
     # Convert dicts to Node/Edge objects; fold unknown keys into metadata
     try:
-        node_objects = []
+        node_dicts = []
         for n in nodes:
             node_dict = dict(n)
             extra = {k: v for k, v in node_dict.items() if k not in _NODE_MODEL_FIELDS}
@@ -79,8 +86,19 @@ def add_nodes(
                 node_dict["metadata"] = meta
                 for k in extra:
                     node_dict.pop(k)
-            node_objects.append(Node(**node_dict))
-        edge_objects = [Edge(**e) for e in edges]
+            node_dicts.append(node_dict)
+        node_objects = _NODES_ADAPTER.validate_python(node_dicts)
+        edge_objects = _EDGES_ADAPTER.validate_python(edges)
+    except ValidationError as e:
+        return {
+            "success": False,
+            "message": f"Error validating input: {str(e)}",
+            "errors": e.errors(
+                include_url=False, include_context=False, include_input=False
+            ),
+            "added_node_ids": [],
+            "added_edge_ids": [],
+        }
     except Exception as e:
         return {
             "success": False,
@@ -200,8 +218,6 @@ def add_edge(
     if denied:
         return denied
 
-    from backend.core.models import Edge as EdgeModel
-
     edge_data: Dict[str, Any] = {"source": source, "target": target}
     if type:
         edge_data["type"] = type
@@ -209,7 +225,7 @@ def add_edge(
         edge_data["label"] = label
 
     try:
-        edge = EdgeModel(**edge_data)
+        edge = Edge(**edge_data)
     except Exception as e:
         return {"success": False, "message": f"Invalid edge data: {str(e)}"}
 
@@ -467,9 +483,7 @@ def adopt_federated_node(
             },
         )
 
-    from backend.core.models import Edge as EdgeModel
-
-    lineage_edge = EdgeModel(
+    lineage_edge = Edge(
         source=local_node.id,
         target=source_reference.id,
         type=relationship_type,
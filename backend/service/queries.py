@@ -12,6 +12,7 @@ from backend.runtime.authorization import GRAPH_ACTION_READ
 
 from . import access
 from .serializers import (
+    dump_json_bytes,
     serialize_edges,
     serialize_graph_stats,
     serialize_node,
@@ -28,6 +29,22 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Direct value -> member lookups for the built-in enums; skips Enum.__call__.
+# Schema-defined types are not cached here because their validity depends on
+# the currently loaded schema.
+_NODE_TYPE_BY_VALUE = {member.value: member for member in NodeType}
+_RELATIONSHIP_TYPE_BY_VALUE = {member.value: member for member in RelationshipType}
+
+
+def _to_node_type(value: str) -> Any:
+    member = _NODE_TYPE_BY_VALUE.get(value)
+    return member if member is not None else NodeType.from_string(value)
+
+
+def _to_relationship_type(value: str) -> RelationshipType:
+    member = _RELATIONSHIP_TYPE_BY_VALUE.get(value)
+    return member if member is not None else RelationshipType(value)
+
 
 def search_graph(
     storage: "GraphStorage",
@@ -49,9 +66,7 @@ def search_graph(
 
     logger.info(f"SEARCH: query='{query}' types={node_types} limit={limit}")
 
-    type_filters = None
-    if node_types:
-        type_filters = [NodeType.from_string(t) for t in node_types]
+    type_filters = [_to_node_type(t) for t in node_types or ()] or None
 
     local_results = storage.search_nodes(
         query=query,
@@ -179,9 +194,7 @@ def get_related_nodes(
     if not access.is_node_visible(node, decision.graph_access):
         return {"success": False, "error": f"Node with ID {node_id} not found"}
 
-    rel_filters = None
-    if relationship_types:
-        rel_filters = [RelationshipType(r) for r in relationship_types]
+    rel_filters = [_to_relationship_type(r) for r in relationship_types or ()] or None
 
     result = storage.get_related_nodes(
         node_id=node_id, relationship_types=rel_filters, depth=depth
@@ -209,7 +222,7 @@ def find_similar_nodes(
     threshold: float = 0.7,
     limit: int = 5,
 ) -> Dict[str, Any]:
-    type_filter = NodeType.from_string(node_type) if node_type else None
+    type_filter = _to_node_type(node_type) if node_type else None
     similar = storage.find_similar_nodes(
         name=name, node_type=type_filter, threshold=threshold, limit=limit
     )
@@ -227,7 +240,7 @@ def find_similar_nodes_batch(
     threshold: float = 0.7,
     limit: int = 5,
 ) -> Dict[str, Any]:
-    type_filter = NodeType.from_string(node_type) if node_type else None
+    type_filter = _to_node_type(node_type) if node_type else None
     results = storage.find_similar_nodes_batch(
         names=names, node_type=type_filter, threshold=threshold, limit=limit
     )
@@ -366,9 +379,18 @@ def get_edge_history(
     }
 
 
-def list_node_types() -> Dict[str, Any]:
+# Type listings derived from the loaded schema. The schema object is replaced
+# (never mutated) on reload, so its identity is a sufficient cache key.
+_type_listing_cache: Dict[str, Any] = {"schema": None}
+
+
+def _type_listings() -> Dict[str, Any]:
     from backend.config import config_loader
 
+    schema_config = config_loader.get_schema_config()
+    if _type_listing_cache["schema"] is schema_config:
+        return _type_listing_cache
+
     schema = config_loader.get_schema()
     node_types = []
     for type_name, type_config in schema.get("node_types", {}).items():
@@ -381,7 +403,33 @@ def list_node_types() -> Dict[str, Any]:
                 "static": type_config.get("static", False),
             }
         )
-    return {"node_types": node_types}
+    relationship_types = []
+    for type_name, type_config in schema.get("relationship_types", {}).items():
+        relationship_types.append(
+            {"type": type_name, "description": type_config.get("description", "")}
+        )
+
+    # Publish the schema key last so concurrent readers never pair it with
+    # listings from a previous schema
+    _type_listing_cache.update(
+        node_types=node_types,
+        relationship_types=relationship_types,
+        node_types_json=dump_json_bytes({"node_types": node_types}),
+        relationship_types_json=dump_json_bytes(
+            {"relationship_types": relationship_types}
+        ),
+        schema=schema_config,
+    )
+    return _type_listing_cache
+
+
+def list_node_types() -> Dict[str, Any]:
+    return {"node_types": [dict(t) for t in _type_listings()["node_types"]]}
+
+
+def list_node_types_json() -> bytes:
+    """``list_node_types()`` as encoded JSON, built once per loaded schema."""
+    return _type_listings()["node_types_json"]
 
 
 def get_subtypes(
@@ -391,15 +439,14 @@ def get_subtypes(
 
 
 def list_relationship_types() -> Dict[str, Any]:
-    from backend.config import config_loader
+    return {
+        "relationship_types": [dict(t) for t in _type_listings()["relationship_types"]]
+    }
 
-    schema = config_loader.get_schema()
-    relationship_types = []
-    for type_name, type_config in schema.get("relationship_types", {}).items():
-        relationship_types.append(
-            {"type": type_name, "description": type_config.get("description", "")}
-        )
-    return {"relationship_types": relationship_types}
+
+def list_relationship_types_json() -> bytes:
+    """``list_relationship_types()`` as encoded JSON, built once per loaded schema."""
+    return _type_listings()["relationship_types_json"]
 
 
 def get_schema() -> Dict[str, Any]:
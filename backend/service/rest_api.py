@@ -22,12 +22,13 @@ import json
 from typing import List, Optional, Dict, Any
 from fastapi import APIRouter, HTTPException, Query, Body, Request, Path
 from fastapi.encoders import jsonable_encoder
-from fastapi.responses import StreamingResponse
+from fastapi.responses import Response, StreamingResponse
 from pydantic import BaseModel, Field
 from pydantic import ValidationError as PydanticValidationError
 
 from backend.runtime.authorization import use_request_authorization
 
+from .serializers import iter_export_json
 from .service import GraphService
 
 
@@ -533,15 +534,19 @@ def _register_metadata_endpoints(router: APIRouter, service: GraphService) -> No
         _raise_for_access_denied(result)
         return result
 
-    @router.get("/meta/node-types")
-    async def list_node_types() -> Dict[str, Any]:
+    # The type listings only change with the schema, so they are served as
+    # JSON encoded once per schema instead of re-encoded per request
+    @router.get("/meta/node-types", response_class=Response)
+    async def list_node_types() -> Response:
         """List all allowed node types according to the schema config."""
-        return service.list_node_types()
+        return Response(service.list_node_types_json(), media_type="application/json")
 
-    @router.get("/meta/relationship-types")
-    async def list_relationship_types() -> Dict[str, Any]:
+    @router.get("/meta/relationship-types", response_class=Response)
+    async def list_relationship_types() -> Response:
         """List all allowed relationship types according to schema config."""
-        return service.list_relationship_types()
+        return Response(
+            service.list_relationship_types_json(), media_type="application/json"
+        )
 
     @router.get("/meta/subtypes")
     async def get_subtypes(
@@ -833,13 +838,20 @@ def _register_session_endpoints(
 
 
 def _register_export_endpoints(router: APIRouter, service: GraphService) -> None:
-    @router.get("/export")
-    async def export_graph(request: Request) -> Dict[str, Any]:
+    def _export_with_authorization(headers: Any) -> Dict[str, Any]:
+        with use_request_authorization(headers=headers):
+            return service.export_graph()
+
+    @router.get("/export", response_class=StreamingResponse)
+    async def export_graph(request: Request) -> StreamingResponse:
         """Export the entire graph (all nodes and edges)."""
-        with use_request_authorization(headers=request.headers):
-            result = service.export_graph()
+        # The payload is already JSON-safe; stream it instead of running it
+        # through jsonable_encoder, and keep the export off the event loop.
+        result = await asyncio.to_thread(_export_with_authorization, request.headers)
         _raise_for_access_denied(result)
-        return result
+        return StreamingResponse(
+            iter_export_json(result), media_type="application/json"
+        )
 
 
 # ==================== Router Factory ====================
@@ -5,8 +5,7 @@ Provides consistent serialization of graph objects for API responses.
 """
 
 import json
-from datetime import datetime
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterator, List
 
 from backend.core import (
     Node,
@@ -16,19 +15,15 @@ from backend.core import (
     AddNodesResult,
     DeleteNodesResult,
     DeleteEdgesResult,
+    json_serializer,
 )
 
 
-def json_serializer(obj: Any) -> Any:
-    """
-    Custom JSON serializer for objects not serializable by default.
+# Nodes/edges encoded per chunk by iter_export_json
+EXPORT_BATCH_SIZE = 1000
 
-    Handles:
-    - datetime objects -> ISO format strings
-    """
-    if isinstance(obj, datetime):
-        return obj.isoformat()
-    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+# Fields never included in serialized nodes
+_NODE_EXCLUDE = {"embedding"}
 
 
 def serialize_to_json(data: Any) -> Any:
@@ -41,27 +36,68 @@ def serialize_to_json(data: Any) -> Any:
     return json.loads(json.dumps(data, default=json_serializer))
 
 
+def dump_json_bytes(value: Any) -> bytes:
+    """
+    Encode data as compact UTF-8 JSON bytes.
+
+    Same options as Starlette's JSONResponse, plus datetime support.
+    """
+    return json.dumps(
+        value,
+        default=json_serializer,
+        ensure_ascii=False,
+        allow_nan=False,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+def iter_export_json(
+    result: Dict[str, Any], batch_size: int = EXPORT_BATCH_SIZE
+) -> Iterator[bytes]:
+    """Encode an export payload incrementally, ``batch_size`` nodes/edges per chunk.
+
+    Avoids building the whole JSON document in memory before the first byte
+    is sent, which matters for large graphs. Batching keeps the number of
+    threadpool hops StreamingResponse makes per export small.
+    """
+    yield b"{"
+    for index, (key, value) in enumerate(result.items()):
+        prefix = b"," if index else b""
+        if isinstance(value, list):
+            yield prefix + dump_json_bytes(key) + b":["
+            for start in range(0, len(value), batch_size):
+                # Encode the batch as one array and strip its brackets
+                chunk = dump_json_bytes(value[start : start + batch_size])[1:-1]
+                yield (b"," if start else b"") + chunk
+            yield b"]"
+        else:
+            yield prefix + dump_json_bytes(key) + b":" + dump_json_bytes(value)
+    yield b"}"
+
+
 def serialize_node(node: Node) -> Dict[str, Any]:
     """
     Serialize a Node to a dictionary.
     Excludes large internal fields like 'embedding'.
     """
-    return serialize_to_json(node.model_dump(exclude={"embedding"}))
+    return json.loads(node.to_json_cached(_NODE_EXCLUDE))
 
 
 def serialize_edge(edge: Edge) -> Dict[str, Any]:
     """Serialize an Edge to a dictionary."""
-    return serialize_to_json(edge.model_dump())
+    return json.loads(edge.to_json_cached())
 
 
 def serialize_nodes(nodes: List[Node]) -> List[Dict[str, Any]]:
-    """Serialize a list of Nodes to dictionaries."""
-    return [serialize_node(node) for node in nodes]
+    """Serialize a list of Nodes to dictionaries (same output as serialize_node)."""
+    return json.loads(
+        "[" + ",".join(n.to_json_cached(_NODE_EXCLUDE) for n in nodes) + "]"
+    )
 
 
 def serialize_edges(edges: List[Edge]) -> List[Dict[str, Any]]:
-    """Serialize a list of Edges to dictionaries."""
-    return [serialize_edge(edge) for edge in edges]
+    """Serialize a list of Edges to dictionaries (same output as serialize_edge)."""
+    return json.loads("[" + ",".join(e.to_json_cached() for e in edges) + "]")
 
 
 def serialize_similar_node(similar: SimilarNode) -> Dict[str, Any]:
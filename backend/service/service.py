@@ -307,12 +307,18 @@ class GraphService:
     def list_node_types(self) -> Dict[str, Any]:
         return queries.list_node_types()
 
+    def list_node_types_json(self) -> bytes:
+        return queries.list_node_types_json()
+
     def get_subtypes(self, node_type: str = None) -> Dict[str, Any]:
         return queries.get_subtypes(self._storage, node_type=node_type)
 
     def list_relationship_types(self) -> Dict[str, Any]:
         return queries.list_relationship_types()
 
+    def list_relationship_types_json(self) -> bytes:
+        return queries.list_relationship_types_json()
+
     def get_schema(self) -> Dict[str, Any]:
         return queries.get_schema()
 
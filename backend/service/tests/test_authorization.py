@@ -336,6 +336,20 @@ class TestGraphAuthorizationSeam:
         }
         assert views == {"success": True, "views": [], "total": 0}
 
+    def test_narrowed_stats_count_only_visible_nodes_and_edges(self, tmp_path):
+        service = _make_saved_view_service(
+            tmp_path,
+            FixedNarrowingHook(
+                allow_local_graph=True, include_graph_ids=("graph-alpha",)
+            ),
+        )
+
+        stats = service.get_graph_stats()
+
+        assert stats["total_nodes"] == 3
+        assert stats["total_edges"] == 1
+        assert stats["nodes_by_type"] == {"Actor": 2, "SavedView": 1}
+
     def test_selection_aware_hook_can_block_adoption_outside_selected_graph(
         self, tmp_path
     ):
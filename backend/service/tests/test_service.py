@@ -4,6 +4,8 @@ Unit tests for GraphService.
 Tests the business logic layer in isolation.
 """
 
+import json
+
 from backend.service import GraphService
 
 
@@ -165,6 +167,19 @@ class TestGraphServiceCRUD:
         assert result["success"] is True
         assert len(result["added_node_ids"]) == 1
 
+    def test_add_nodes_validation_errors_locate_item(self, empty_service: GraphService):
+        """Validation failures report which list item and field were invalid."""
+        nodes = [
+            {"type": "Actor", "name": "Valid"},
+            {"type": "Actor", "description": "Missing name"},
+        ]
+        result = empty_service.add_nodes(nodes=nodes, edges=[])
+
+        assert result["success"] is False
+        assert result["message"].startswith("Error validating input")
+        assert [err["loc"] for err in result["errors"]] == [(1, "name")]
+        assert empty_service.get_graph_stats()["total_nodes"] == 0
+
     def test_update_node(self, populated_service: GraphService):
         """Test updating a node."""
         result = populated_service.update_node(
@@ -330,6 +345,17 @@ class TestGraphServiceStatistics:
         for rt in result["relationship_types"]:
             assert "description" in rt
 
+    def test_type_listing_json_matches_listings(self, empty_service: GraphService):
+        """The pre-encoded listings decode to the same payload as the dicts."""
+        assert (
+            json.loads(empty_service.list_node_types_json())
+            == empty_service.list_node_types()
+        )
+        assert (
+            json.loads(empty_service.list_relationship_types_json())
+            == empty_service.list_relationship_types()
+        )
+
 
 class TestGraphServiceSavedViews:
     """Tests for saved view operations."""
@@ -462,3 +488,41 @@ class TestGraphServiceSerialization:
         # All node timestamps should be strings
         for node in result["nodes"]:
             assert isinstance(node["created_at"], str)
+
+    def test_list_serializers_match_single_item_serializers(
+        self, populated_service: GraphService
+    ):
+        """Batch node/edge serialization yields exactly the per-item output."""
+        from backend.service.serializers import (
+            serialize_edge,
+            serialize_edges,
+            serialize_node,
+            serialize_nodes,
+        )
+
+        storage = populated_service.storage
+        nodes = storage.get_all_nodes()
+        nodes[0].embedding = [0.5, 0.25]
+        edges = storage.get_all_edges()
+
+        assert serialize_nodes(nodes) == [serialize_node(n) for n in nodes]
+        assert all("embedding" not in n for n in serialize_nodes(nodes))
+        assert serialize_edges(edges) == [serialize_edge(e) for e in edges]
+        assert serialize_nodes(nodes)[0]["created_at"].endswith("+00:00")
+
+    def test_serialized_node_refreshes_after_update(
+        self, populated_service: GraphService
+    ):
+        """Cached node JSON is reused until the node is updated."""
+        from backend.service.serializers import serialize_node
+
+        node = populated_service.storage.get_node("actor-1")
+        first = serialize_node(node)
+        first["name"] = "mutated by caller"
+        assert serialize_node(node)["name"] != "mutated by caller"
+
+        populated_service.update_node("actor-1", {"description": "Changed"})
+        assert serialize_node(node)["description"] == "Changed"
+
+        copied = node.model_copy(update={"name": "Copy"})
+        assert serialize_node(copied)["name"] == "Copy"
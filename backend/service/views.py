@@ -5,13 +5,14 @@ All functions are standalone; they receive storage and the authorization hook
 as explicit parameters.
 """
 
+from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Any, Dict, List
 
 from backend.core import NodeType
 from backend.runtime.authorization import GRAPH_ACTION_READ
 
 from . import access
-from .serializers import serialize_edges, serialize_node
+from .serializers import serialize_edges, serialize_node, serialize_nodes
 
 if TYPE_CHECKING:
     from backend.core import GraphStorage
@@ -69,18 +70,10 @@ def get_saved_view(
             action=GRAPH_ACTION_READ, target="get_saved_view", decision=decision
         )
 
-    results = storage.search_nodes(
-        query=name,
-        node_types=[NodeType.SAVED_VIEW, NodeType.VISUALIZATION_VIEW],
-        limit=max(100, storage.get_stats().total_nodes)
-        if decision.graph_access.enabled
-        else 1,
-    )
-
     visible_views = [
         view
-        for view in results
-        if view.name == name and access.is_node_visible(view, decision.graph_access)
+        for view in storage.get_views_by_name(name)
+        if access.is_node_visible(view, decision.graph_access)
     ]
 
     if not visible_views:
@@ -224,10 +217,6 @@ def export_graph(
     storage: "GraphStorage",
     hook: "GraphAuthorizationHook",
 ) -> Dict[str, Any]:
-    from datetime import datetime, timezone
-
-    from .serializers import serialize_edges as ser_edges, serialize_nodes as ser_nodes
-
     decision = access.evaluate_graph_access(
         hook, action=GRAPH_ACTION_READ, target="export_graph"
     )
@@ -243,8 +232,8 @@ def export_graph(
         edges=source_edges,
         graph_access=decision.graph_access,
     )
-    all_nodes = ser_nodes(visible_nodes)
-    all_edges = ser_edges(visible_edges)
+    all_nodes = serialize_nodes(visible_nodes)
+    all_edges = serialize_edges(visible_edges)
     export_boundary = access.build_export_boundary_summary(
         target="export_graph",
         decision=decision,
@@ -466,6 +466,39 @@ class TestConfigLoader:
         assert path is not None
         assert isinstance(path, str)
 
+    def test_concurrent_first_access_loads_config_once(self):
+        """Racing first calls share one loader and read the schema once."""
+        import threading
+        import time
+        from unittest.mock import patch
+
+        from backend.config import config_loader
+
+        original_load = config_loader.ConfigLoader._load_config
+        loads = []
+
+        def _slow_load(self):
+            loads.append(1)
+            time.sleep(0.05)
+            original_load(self)
+
+        start = threading.Barrier(8)
+        loaders = []
+
+        def _worker():
+            start.wait()
+            loaders.append(config_loader._get_loader())
+
+        with patch.object(config_loader.ConfigLoader, "_load_config", _slow_load):
+            threads = [threading.Thread(target=_worker) for _ in range(8)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+
+        assert len(loads) == 1
+        assert len({id(loader) for loader in loaders}) == 1
+
 
 class TestSchemaIntegration:
     """Integration tests for schema with other backend components."""
@@ -613,6 +646,32 @@ class TestConfigWithAlternateFile:
         assert presentation["colors"]["CustomActor"] == "#FF0000"
         assert presentation["colors"]["TestNode"] == "#00FF00"
 
+    def test_list_node_types_follows_schema_reload(self):
+        """Cached type listings are rebuilt when a different schema is loaded."""
+        pytest.importorskip("networkx")
+        from backend.config import config_loader
+        from backend.service import queries
+
+        default_types = {t["type"] for t in queries.list_node_types()["node_types"]}
+        assert "CustomActor" not in default_types
+
+        test_config_path = str(
+            Path(__file__).parent.parent.parent
+            / "config"
+            / "test"
+            / "schema_config.json"
+        )
+        os.environ["SCHEMA_FILE"] = test_config_path
+        config_loader.reset_loader()
+
+        listed = {t["type"]: t for t in queries.list_node_types()["node_types"]}
+        assert listed["CustomActor"]["color"] == "#FF0000"
+
+        # Returned entries are copies; mutating them must not leak into the cache
+        listed["CustomActor"]["color"] = "#000000"
+        again = {t["type"]: t for t in queries.list_node_types()["node_types"]}
+        assert again["CustomActor"]["color"] == "#FF0000"
+
 
 class TestTenantContext:
     """Tests for get_tenant_context() function."""
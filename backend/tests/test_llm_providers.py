@@ -0,0 +1,75 @@
+"""
+Unit tests for the Claude provider request shape in llm_providers.py.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from backend.llm.llm_providers import ClaudeProvider
+
+
+class _RecordingMessages:
+    def __init__(self):
+        self.calls = []
+
+    def create(self, **kwargs):
+        self.calls.append(kwargs)
+        return SimpleNamespace(content=[], stop_reason="end_turn")
+
+
+@pytest.fixture(scope="module")
+def claude_provider():
+    """One provider per module; the request-shaping helpers are stateless."""
+    return ClaudeProvider(api_key="sk-ant-test")
+
+
+@pytest.fixture
+def recorded_messages(claude_provider, monkeypatch):
+    """Swap a fresh recording client onto the shared provider for one test."""
+    messages = _RecordingMessages()
+    monkeypatch.setattr(claude_provider, "client", SimpleNamespace(messages=messages))
+    return messages
+
+
+class TestClaudeProviderPromptCaching:
+    """Tests for prompt-caching markers on Claude requests."""
+
+    def test_system_prompt_and_last_tool_are_marked_for_caching(
+        self, claude_provider, recorded_messages
+    ):
+        tools = [
+            {"name": "search_graph", "input_schema": {"type": "object"}},
+            {"name": "get_graph_stats", "input_schema": {"type": "object"}},
+        ]
+
+        claude_provider.create_completion(
+            messages=[{"role": "user", "content": "hi"}],
+            system_prompt="You are helpful.",
+            tools=tools,
+        )
+
+        call = recorded_messages.calls[0]
+        assert call["system"] == [
+            {
+                "type": "text",
+                "text": "You are helpful.",
+                "cache_control": {"type": "ephemeral"},
+            }
+        ]
+        assert "cache_control" not in call["tools"][0]
+        assert call["tools"][1]["cache_control"] == {"type": "ephemeral"}
+        assert "cache_control" not in tools[1]
+
+    def test_empty_system_prompt_and_tools_are_passed_through(
+        self, claude_provider, recorded_messages
+    ):
+        claude_provider.create_completion(
+            messages=[{"role": "user", "content": "hi"}],
+            system_prompt="",
+            tools=[],
+        )
+
+        call = recorded_messages.calls[0]
+        assert call["system"] == ""
+        assert call["tools"] == []
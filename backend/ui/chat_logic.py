@@ -1,7 +1,8 @@
-from typing import List, Dict, Callable
+from typing import List, Dict, Callable, FrozenSet
 import os
 import json
 import logging
+import weakref
 from dotenv import load_dotenv
 import inspect
 from backend.llm.llm_providers import create_provider, LLMProvider
@@ -14,6 +15,26 @@ logger = logging.getLogger(__name__)
 # Load environment variables
 load_dotenv()
 
+# Accepted parameter names per tool function, resolved once per callable.
+# Weak keys so per-request overlay closures don't accumulate.
+_tool_params: "weakref.WeakKeyDictionary[Callable, FrozenSet[str]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _tool_param_names(func: Callable) -> FrozenSet[str]:
+    """Return the keyword names ``func`` accepts, caching the signature lookup."""
+    try:
+        return _tool_params[func]
+    except KeyError:
+        pass
+    except TypeError:
+        # Not weak-referenceable; inspect every time
+        return frozenset(inspect.signature(func).parameters)
+    names = frozenset(inspect.signature(func).parameters)
+    _tool_params[func] = names
+    return names
+
 
 def _build_system_prompt() -> str:
     """
@@ -1125,7 +1146,10 @@ class ChatProcessor:
         active_system_prompt = (
             system_prompt if system_prompt is not None else self.system_prompt
         )
-        effective_tools = {**self.tools_map, **(tools_override or {})}
+        # Only copy the tool map when a per-request override must be layered on
+        effective_tools = (
+            {**self.tools_map, **tools_override} if tools_override else self.tools_map
+        )
 
         # Find ALL tool_use blocks (LLM can request multiple tools in parallel)
         tool_uses = [
@@ -1198,11 +1222,9 @@ class ChatProcessor:
                     # Call the actual python function
                     func = effective_tools[tool_name]
 
-                    # Check signature
-                    sig = inspect.signature(func)
-                    valid_args = {
-                        k: v for k, v in tool_input.items() if k in sig.parameters
-                    }
+                    # Drop arguments the function doesn't accept
+                    params = _tool_param_names(func)
+                    valid_args = {k: v for k, v in tool_input.items() if k in params}
 
                     tool_result = func(**valid_args)
                 except Exception as e:
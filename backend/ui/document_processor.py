@@ -1,7 +1,19 @@
+import io
 import os
+from typing import BinaryIO, Union
+
 import docx
 
-from backend.core.pdf_extractor import extract_text_from_pdf_path
+from backend.core.pdf_extractor import extract_text_from_pdf, extract_text_from_pdf_path
+
+
+# File extension -> DocumentProcessor parser method
+_PARSERS_BY_EXTENSION = {
+    ".pdf": "parse_pdf",
+    ".docx": "parse_docx",
+    ".doc": "parse_docx",
+    ".txt": "parse_txt",
+}
 
 
 class DocumentProcessor:
@@ -24,30 +36,58 @@ class DocumentProcessor:
         _, ext = os.path.splitext(file_path)
         ext = ext.lower()
 
-        if ext == ".pdf":
-            return DocumentProcessor.parse_pdf(file_path)
-        elif ext in [".docx", ".doc"]:
-            return DocumentProcessor.parse_docx(file_path)
-        elif ext == ".txt":
-            with open(file_path, "r", encoding="utf-8") as f:
-                return f.read()
-        else:
+        parser = _PARSERS_BY_EXTENSION.get(ext)
+        if parser is None:
+            raise ValueError(f"Unsupported file format: {ext}")
+        return getattr(DocumentProcessor, parser)(file_path)
+
+    @staticmethod
+    def extract_text_from_bytes(content: bytes, filename: str) -> str:
+        """
+        Extract text from in-memory file content, using the filename's extension.
+
+        Args:
+            content: The file content as bytes
+            filename: Name used only to pick the parser
+
+        Returns:
+            Extracted text content
+
+        Raises:
+            ValueError: If file format is not supported
+        """
+        _, ext = os.path.splitext(filename)
+        ext = ext.lower()
+
+        parser = _PARSERS_BY_EXTENSION.get(ext)
+        if parser is None:
             raise ValueError(f"Unsupported file format: {ext}")
+        return getattr(DocumentProcessor, parser)(io.BytesIO(content))
 
     @staticmethod
-    def parse_pdf(file_path: str) -> str:
-        """Extract text from PDF using pypdf."""
+    def parse_pdf(source: Union[str, BinaryIO]) -> str:
+        """Extract text from PDF (path or binary stream) using pypdf."""
         try:
-            return extract_text_from_pdf_path(file_path)
+            if isinstance(source, str):
+                return extract_text_from_pdf_path(source)
+            return extract_text_from_pdf(source.read())
         except Exception as e:
             raise Exception(f"Error parsing PDF: {str(e)}")
 
     @staticmethod
-    def parse_docx(file_path: str) -> str:
-        """Extract text from Word document"""
+    def parse_docx(source: Union[str, BinaryIO]) -> str:
+        """Extract text from Word document (path or binary stream)"""
         try:
-            doc = docx.Document(file_path)
+            doc = docx.Document(source)
             text = [paragraph.text for paragraph in doc.paragraphs]
             return "\n".join(text)
         except Exception as e:
             raise Exception(f"Error parsing Word document: {str(e)}")
+
+    @staticmethod
+    def parse_txt(source: Union[str, BinaryIO]) -> str:
+        """Read UTF-8 plain text (path or binary stream)"""
+        if isinstance(source, str):
+            with open(source, "r", encoding="utf-8") as f:
+                return f.read()
+        return source.read().decode("utf-8")
@@ -10,9 +10,14 @@ All graph mutations resulting from document analysis
 go through ChatService -> GraphService.
 """
 
-import os
+import asyncio
+import hashlib
+import re
 import tempfile
-from typing import Optional, Dict, Any
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Optional, Dict, Any
 from pathlib import Path
 
 from backend.ui.document_processor import DocumentProcessor
@@ -37,6 +42,9 @@ class DocumentService:
     # Max file size (10 MB)
     MAX_FILE_SIZE = 10 * 1024 * 1024
 
+    # Extracted texts kept for repeat uploads of identical content
+    TEXT_CACHE_SIZE = 128
+
     def __init__(self, upload_dir: Optional[str] = None):
         """
         Initialize DocumentService.
@@ -47,6 +55,9 @@ class DocumentService:
         """
         self._upload_dir = upload_dir or tempfile.gettempdir()
         Path(self._upload_dir).mkdir(parents=True, exist_ok=True)
+        # (content digest, extension) -> extracted text, least recently used first
+        self._text_cache: "OrderedDict[tuple, str]" = OrderedDict()
+        self._text_cache_lock = threading.Lock()
 
     def extract_text_from_file(self, file_path: str) -> Dict[str, Any]:
         """
@@ -81,12 +92,58 @@ class DocumentService:
             }
 
         # Extract text
+        return self._extraction_result(
+            lambda: DocumentProcessor.extract_text(str(path)), path.name
+        )
+
+    def extract_text_from_bytes(
+        self, file_content: bytes, filename: str
+    ) -> Dict[str, Any]:
+        """
+        Extract text from in-memory file content without writing it to disk.
+
+        Args:
+            file_content: The file content as bytes
+            filename: Filename reported back; its extension selects the parser
+
+        Identical content (same bytes and extension) is parsed once; repeat
+        uploads are served from a small LRU cache.
+
+        Returns:
+            Dict with the same keys as extract_text_from_file
+        """
+        return self._extraction_result(
+            lambda: self._cached_extract(file_content, filename), filename
+        )
+
+    def _cached_extract(self, file_content: bytes, filename: str) -> str:
+        key = (
+            hashlib.blake2b(file_content, digest_size=16).digest(),
+            Path(filename).suffix.lower(),
+        )
+        with self._text_cache_lock:
+            text = self._text_cache.get(key)
+            if text is not None:
+                self._text_cache.move_to_end(key)
+                return text
+
+        text = DocumentProcessor.extract_text_from_bytes(file_content, filename)
+
+        with self._text_cache_lock:
+            self._text_cache[key] = text
+            self._text_cache.move_to_end(key)
+            while len(self._text_cache) > self.TEXT_CACHE_SIZE:
+                self._text_cache.popitem(last=False)
+        return text
+
+    @staticmethod
+    def _extraction_result(extract: Callable[[], str], filename: str) -> Dict[str, Any]:
         try:
-            text = DocumentProcessor.extract_text(str(path))
+            text = extract()
             return {
                 "success": True,
                 "text": text,
-                "filename": path.name,
+                "filename": filename,
                 "char_count": len(text),
                 "word_count": len(text.split()),
             }
@@ -94,9 +151,27 @@ class DocumentService:
             return {
                 "success": False,
                 "error": f"Error extracting text: {str(e)}",
-                "filename": path.name,
+                "filename": filename,
+            }
+
+    def _validate_upload(
+        self, file_content: bytes, filename: str
+    ) -> Optional[Dict[str, Any]]:
+        """Return an error result if the upload is unsupported or too large."""
+        ext = Path(filename).suffix.lower()
+        if ext not in self.SUPPORTED_EXTENSIONS:
+            return {
+                "success": False,
+                "error": f"Unsupported file format: {ext}. Supported: {', '.join(self.SUPPORTED_EXTENSIONS)}",
             }
 
+        if len(file_content) > self.MAX_FILE_SIZE:
+            return {
+                "success": False,
+                "error": f"File too large. Max size: {self.MAX_FILE_SIZE / 1024 / 1024:.1f} MB",
+            }
+        return None
+
     async def save_upload(self, file_content: bytes, filename: str) -> Dict[str, Any]:
         """
         Save an uploaded file to temporary storage.
@@ -111,20 +186,9 @@ class DocumentService:
             - file_path: Path to saved file (if successful)
             - error: Error message (if failed)
         """
-        # Validate extension
-        ext = Path(filename).suffix.lower()
-        if ext not in self.SUPPORTED_EXTENSIONS:
-            return {
-                "success": False,
-                "error": f"Unsupported file format: {ext}. Supported: {', '.join(self.SUPPORTED_EXTENSIONS)}",
-            }
-
-        # Validate size
-        if len(file_content) > self.MAX_FILE_SIZE:
-            return {
-                "success": False,
-                "error": f"File too large. Max size: {self.MAX_FILE_SIZE / 1024 / 1024:.1f} MB",
-            }
+        error = self._validate_upload(file_content, filename)
+        if error:
+            return error
 
         # Create safe filename
         safe_filename = self._sanitize_filename(filename)
@@ -132,8 +196,7 @@ class DocumentService:
         # Save to temp directory
         try:
             file_path = Path(self._upload_dir) / safe_filename
-            with open(file_path, "wb") as f:
-                f.write(file_content)
+            await asyncio.to_thread(file_path.write_bytes, file_content)
 
             return {
                 "success": True,
@@ -150,8 +213,8 @@ class DocumentService:
         """
         Save and extract text from an uploaded file.
 
-        This is a convenience method that combines save_upload
-        and extract_text_from_file.
+        Extraction runs on the in-memory content, so the upload never
+        touches disk.
 
         Args:
             file_content: The file content as bytes
@@ -160,22 +223,15 @@ class DocumentService:
         Returns:
             Dict with extraction results
         """
-        # Save the file
-        save_result = await self.save_upload(file_content, filename)
-        if not save_result["success"]:
-            return save_result
+        error = self._validate_upload(file_content, filename)
+        if error:
+            return error
 
-        # Extract text
-        file_path = save_result["file_path"]
-        extract_result = self.extract_text_from_file(file_path)
-
-        # Clean up temp file
-        try:
-            os.remove(file_path)
-        except Exception:
-            pass  # Ignore cleanup errors
-
-        return extract_result
+        return await asyncio.to_thread(
+            self.extract_text_from_bytes,
+            file_content,
+            self._sanitize_filename(filename),
+        )
 
     def _sanitize_filename(self, filename: str) -> str:
         """
@@ -187,9 +243,6 @@ class DocumentService:
         Returns:
             Sanitized filename with timestamp prefix
         """
-        import time
-        import re
-
         # Remove path components
         name = Path(filename).name
 
@@ -211,8 +264,6 @@ class DocumentService:
         Returns:
             Number of files deleted
         """
-        import time
-
         deleted = 0
         max_age_seconds = max_age_hours * 3600
         now = time.time()
@@ -9,10 +9,13 @@ All graph mutations go through ChatService -> GraphService.
 This module does NOT create graph objects directly.
 """
 
+import asyncio
 from typing import List, Dict, Any, Optional
 from fastapi import APIRouter, UploadFile, File, Form, HTTPException
 from pydantic import BaseModel, Field, field_validator
 
+from backend.llm.llm_providers import get_llm_availability
+
 from .chat_service import ChatService
 from .document_service import DocumentService
 
@@ -173,7 +176,10 @@ def create_ui_router(
             # Convert messages to dict format
             messages = [msg.model_dump() for msg in request.messages]
 
-            result = chat_service.process_message(
+            # LLM round-trips and tool calls block; keep them off the event loop.
+            # Thread safety: GraphStorage serializes reads and writes on its _lock.
+            result = await asyncio.to_thread(
+                chat_service.process_message,
                 messages=messages,
                 api_key=request.api_key,
                 provider=request.provider,
@@ -208,7 +214,9 @@ def create_ui_router(
             LLM response with any tool results
         """
         try:
-            result = chat_service.process_chat_request(
+            # Worker thread; GraphStorage serializes reads and writes on its _lock.
+            result = await asyncio.to_thread(
+                chat_service.process_chat_request,
                 user_message=request.message,
                 api_key=request.api_key,
                 provider=request.provider,
@@ -244,7 +252,9 @@ def create_ui_router(
             Proposed nodes with similarity information
         """
         try:
-            result = chat_service.propose_nodes_from_text(
+            # Worker thread; GraphStorage serializes reads and writes on its _lock.
+            result = await asyncio.to_thread(
+                chat_service.propose_nodes_from_text,
                 text=request.text,
                 node_type=request.node_type,
                 communities=request.communities,
@@ -316,7 +326,9 @@ def create_ui_router(
                     or "Please analyze this document and summarize its main points."
                 )
 
-                chat_result = chat_service.process_chat_request(
+                # Worker thread; GraphStorage serializes reads and writes on its _lock.
+                chat_result = await asyncio.to_thread(
+                    chat_service.process_chat_request,
                     user_message=user_message,
                     document_context=result["text"],
                     api_key=api_key,
@@ -371,8 +383,6 @@ def create_ui_router(
         Currently reports LLM availability so the chat panel can be hidden when
         no API keys are configured.
         """
-        from backend.llm.llm_providers import get_llm_availability
-
         llm = get_llm_availability()
         return {
             "llm_available": llm["available"],
@@ -261,6 +261,30 @@ class TestGraphServiceIntegration:
         tool_result = result.get("toolResult", {})
         assert tool_result.get("total", 0) >= 1 or "nodes" in tool_result
 
+    def test_tool_call_drops_unknown_arguments_and_caches_signature(self, chat_service):
+        """Unknown tool arguments are dropped; the signature is inspected once."""
+        from backend.ui import chat_logic
+
+        service, mock_llm = chat_service
+        mock_llm.mock_tool_calls = [
+            {"name": "search_graph", "input": {"query": "x", "bogus": 1}}
+        ]
+        mock_llm.mock_text_response = "Done."
+
+        with patch.object(
+            chat_logic.inspect, "signature", wraps=chat_logic.inspect.signature
+        ) as sig:
+            first = service.process_message([{"role": "user", "content": "a"}])
+            mock_llm.reset()
+            mock_llm.mock_tool_calls = [
+                {"name": "search_graph", "input": {"query": "x", "bogus": 1}}
+            ]
+            mock_llm.mock_text_response = "Done."
+            service.process_message([{"role": "user", "content": "b"}])
+
+        assert "error" not in first.get("toolResult", {})
+        assert sig.call_count == 1
+
 
 # ---------------------------------------------------------------------------
 # Expert agent skills injection
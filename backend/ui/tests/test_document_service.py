@@ -7,7 +7,6 @@ Verifies that:
 - Temporary file handling is correct
 """
 
-import tempfile
 import os
 from pathlib import Path
 
@@ -32,17 +31,11 @@ class TestDocumentServiceExtraction:
         assert "not found" in result["error"].lower()
 
     def test_extract_text_unsupported_format(self, document_service):
-        """Should return error for unsupported formats."""
-        with tempfile.NamedTemporaryFile(suffix=".xyz", delete=False) as f:
-            f.write(b"test")
-            path = f.name
+        """Should return error for unsupported formats before touching the file."""
+        result = document_service.extract_text_from_file("/nonexistent/file.xyz")
 
-        try:
-            result = document_service.extract_text_from_file(path)
-            assert not result["success"]
-            assert "unsupported" in result["error"].lower()
-        finally:
-            os.unlink(path)
+        assert not result["success"]
+        assert "unsupported" in result["error"].lower()
 
 
 class TestDocumentServiceUpload:
@@ -100,7 +93,66 @@ class TestDocumentServiceUpload:
 
         assert result["success"]
         assert "test content" in result["text"].lower()
-        # Temp file should be cleaned up (can't easily verify, but no error is good)
+        # Extraction happens in memory; nothing is left in the upload dir
+        assert os.listdir(document_service._upload_dir) == []
+
+    def test_process_upload_extracts_docx_from_memory(self, document_service):
+        """Word uploads are parsed straight from the uploaded bytes."""
+        import asyncio
+        import io
+
+        import docx
+
+        buffer = io.BytesIO()
+        doc = docx.Document()
+        doc.add_paragraph("Memo about data sharing")
+        doc.save(buffer)
+
+        result = asyncio.run(
+            document_service.process_upload(buffer.getvalue(), "memo.docx")
+        )
+
+        assert result["success"]
+        assert "data sharing" in result["text"]
+        assert result["filename"].endswith("memo.docx")
+
+    def test_process_upload_reuses_text_for_identical_content(self, document_service):
+        """Re-uploading the same bytes skips the parser."""
+        import asyncio
+        from unittest.mock import patch
+
+        from backend.ui.document_processor import DocumentProcessor
+
+        content = b"Repeat upload content."
+        with patch.object(
+            DocumentProcessor,
+            "extract_text_from_bytes",
+            wraps=DocumentProcessor.extract_text_from_bytes,
+        ) as extract:
+            first = asyncio.run(document_service.process_upload(content, "a.txt"))
+            second = asyncio.run(document_service.process_upload(content, "b.txt"))
+            asyncio.run(document_service.process_upload(b"Other.", "a.txt"))
+
+        assert first["text"] == second["text"] == "Repeat upload content."
+        assert second["filename"].endswith("b.txt")
+        assert extract.call_count == 2
+
+    def test_text_cache_is_bounded(self, document_service):
+        """Least recently used entries are evicted past TEXT_CACHE_SIZE."""
+        document_service.TEXT_CACHE_SIZE = 2
+        for i in range(3):
+            document_service.extract_text_from_bytes(f"doc {i}".encode(), "x.txt")
+
+        assert len(document_service._text_cache) == 2
+
+    def test_process_upload_rejects_unsupported_format(self, document_service):
+        """Validation still applies before any extraction."""
+        import asyncio
+
+        result = asyncio.run(document_service.process_upload(b"x", "page.html"))
+
+        assert not result["success"]
+        assert "unsupported" in result["error"].lower()
 
 
 class TestDocumentServiceFileSanitization:
@@ -14,8 +14,14 @@ Usage:
 
     # Or with custom URL:
     E2E_SERVER_URL=http://localhost:8080 python scripts/test-e2e-live.py
+
+    # Only print errors:
+    E2E_QUIET=1 python scripts/test-e2e-live.py
 """
 
+import asyncio
+import inspect
+import json
 import os
 import sys
 import time
@@ -24,17 +30,79 @@ import httpx2 as httpx
 SERVER_URL = os.environ.get("E2E_SERVER_URL", "http://localhost:8000")
 API_PREFIX = "/api/v1"
 
+URL_ROOT = f"{SERVER_URL}/"
+URL_HEALTH = f"{SERVER_URL}/health"
+URL_SEARCH = f"{SERVER_URL}{API_PREFIX}/search"
+URL_STATS = f"{SERVER_URL}{API_PREFIX}/stats"
+URL_EXEC = f"{SERVER_URL}/execute_tool"
+URL_EXPORT = f"{SERVER_URL}/export_graph"
+
+# Request bodies sent more than once are encoded a single time up front.
+JSON_HEADERS = {"content-type": "application/json"}
+BODY_GET_STATS = json.dumps({"tool_name": "get_graph_stats", "arguments": {}}).encode()
+
+# HTTP/2 multiplexes concurrent requests over one connection when the server
+# negotiates it (TLS/ALPN); it needs the optional ``h2`` package.
+try:
+    import h2  # noqa: F401
+
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+ASYNC_LIMITS = httpx.Limits(max_connections=5, max_keepalive_connections=5)
+
+RETRY_TOTAL = 3
+RETRY_BACKOFF = 0.1
+RETRY_STATUS = frozenset({502, 503, 504})
+
+
+class RetryTransport(httpx.HTTPTransport):
+    """Transport that retries gateway errors with a short exponential backoff.
+
+    Connection failures are retried by the base transport (``retries``), so a
+    server that is still warming up does not fail the run outright.
+    """
+
+    def handle_request(self, request):
+        for attempt in range(RETRY_TOTAL):
+            response = super().handle_request(request)
+            if response.status_code not in RETRY_STATUS:
+                return response
+            response.close()
+            time.sleep(RETRY_BACKOFF * (2**attempt))
+        return super().handle_request(request)
+
+
+CLIENT = httpx.Client(
+    transport=RetryTransport(
+        retries=RETRY_TOTAL, limits=httpx.Limits(max_connections=20)
+    )
+)
+
+
+QUIET = bool(os.environ.get("E2E_QUIET"))
+
+_LOG_FORMAT = "[%s] [%s] %s\n"
+_log_clock = {"second": None, "timestamp": ""}
+
 
 def log(message: str, level: str = "INFO"):
-    """Log a message with timestamp."""
-    timestamp = time.strftime("%H:%M:%S")
-    print(f"[{timestamp}] [{level}] {message}")
+    """Log a message with timestamp (INFO lines are dropped when E2E_QUIET is set)."""
+    if QUIET and level == "INFO":
+        return
+    # Only re-format the timestamp when the wall-clock second changes
+    second = int(time.time())
+    if second != _log_clock["second"]:
+        _log_clock["second"] = second
+        _log_clock["timestamp"] = time.strftime("%H:%M:%S", time.localtime(second))
+    sys.stdout.write(_LOG_FORMAT % (_log_clock["timestamp"], level, message))
 
 
 def check_server_health() -> bool:
     """Check if the server is running and healthy."""
     try:
-        response = httpx.get(f"{SERVER_URL}/health", timeout=5)
+        response = CLIENT.get(URL_HEALTH, timeout=5)
         if response.status_code == 200:
             data = response.json()
             log(
@@ -49,7 +117,7 @@ def check_server_health() -> bool:
 def test_root_endpoint():
     """Test the root endpoint returns API info."""
     log("Testing root endpoint...")
-    response = httpx.get(f"{SERVER_URL}/")
+    response = CLIENT.get(URL_ROOT)
     assert response.status_code == 200, f"Expected 200, got {response.status_code}"
     data = response.json()
     assert "name" in data, "Missing 'name' in response"
@@ -60,7 +128,7 @@ def test_root_endpoint():
 def test_health_endpoint():
     """Test the health check endpoint."""
     log("Testing health endpoint...")
-    response = httpx.get(f"{SERVER_URL}/health")
+    response = CLIENT.get(URL_HEALTH)
     assert response.status_code == 200
     data = response.json()
     assert data["status"] == "healthy"
@@ -72,9 +140,7 @@ def test_health_endpoint():
 def test_rest_search():
     """Test REST API search endpoint."""
     log("Testing REST search...")
-    response = httpx.get(
-        f"{SERVER_URL}{API_PREFIX}/search", params={"query": "", "limit": 5}
-    )
+    response = CLIENT.get(URL_SEARCH, params={"query": "", "limit": 5})
     assert response.status_code == 200, f"Search failed: {response.text}"
     data = response.json()
     assert "nodes" in data
@@ -85,7 +151,7 @@ def test_rest_search():
 def test_rest_get_stats():
     """Test REST API stats endpoint."""
     log("Testing REST stats...")
-    response = httpx.get(f"{SERVER_URL}{API_PREFIX}/stats")
+    response = CLIENT.get(URL_STATS)
     assert response.status_code == 200, f"Stats failed: {response.text}"
     data = response.json()
     assert "total_nodes" in data
@@ -97,8 +163,8 @@ def test_rest_get_stats():
 def test_execute_tool_search():
     """Test the execute_tool endpoint with search_graph."""
     log("Testing execute_tool with search_graph...")
-    response = httpx.post(
-        f"{SERVER_URL}/execute_tool",
+    response = CLIENT.post(
+        URL_EXEC,
         json={"tool_name": "search_graph", "arguments": {"query": "", "limit": 5}},
     )
     assert response.status_code == 200, f"execute_tool failed: {response.text}"
@@ -110,10 +176,7 @@ def test_execute_tool_search():
 def test_execute_tool_get_stats():
     """Test the execute_tool endpoint with get_graph_stats."""
     log("Testing execute_tool with get_graph_stats...")
-    response = httpx.post(
-        f"{SERVER_URL}/execute_tool",
-        json={"tool_name": "get_graph_stats", "arguments": {}},
-    )
+    response = CLIENT.post(URL_EXEC, content=BODY_GET_STATS, headers=JSON_HEADERS)
     assert response.status_code == 200, f"execute_tool failed: {response.text}"
     data = response.json()
     assert "total_nodes" in data
@@ -123,8 +186,8 @@ def test_execute_tool_get_stats():
 def test_execute_tool_invalid_tool():
     """Test execute_tool with invalid tool name returns 404."""
     log("Testing execute_tool with invalid tool...")
-    response = httpx.post(
-        f"{SERVER_URL}/execute_tool",
+    response = CLIENT.post(
+        URL_EXEC,
         json={"tool_name": "nonexistent_tool", "arguments": {}},
     )
     assert response.status_code == 404, f"Expected 404, got {response.status_code}"
@@ -136,7 +199,7 @@ def test_execute_tool_invalid_tool():
 def test_execute_tool_missing_name():
     """Test execute_tool without tool name returns 400."""
     log("Testing execute_tool without tool name...")
-    response = httpx.post(f"{SERVER_URL}/execute_tool", json={"arguments": {}})
+    response = CLIENT.post(URL_EXEC, json={"arguments": {}})
     assert response.status_code == 400, f"Expected 400, got {response.status_code}"
     log("✓ execute_tool correctly returns 400 for missing tool name")
 
@@ -144,7 +207,7 @@ def test_execute_tool_missing_name():
 def test_export_graph():
     """Test the export_graph endpoint."""
     log("Testing export_graph...")
-    response = httpx.get(f"{SERVER_URL}/export_graph")
+    response = CLIENT.get(URL_EXPORT)
     assert response.status_code == 200, f"Export failed: {response.text}"
     data = response.json()
     assert "nodes" in data
@@ -158,8 +221,8 @@ def test_crud_workflow():
 
     # 1. Add nodes
     log("  Adding test nodes...")
-    response = httpx.post(
-        f"{SERVER_URL}/execute_tool",
+    response = CLIENT.post(
+        URL_EXEC,
         json={
             "tool_name": "add_nodes",
             "arguments": {
@@ -196,8 +259,8 @@ def test_crud_workflow():
 
     # 2. Get node details
     log("  Getting node details...")
-    response = httpx.post(
-        f"{SERVER_URL}/execute_tool",
+    response = CLIENT.post(
+        URL_EXEC,
         json={
             "tool_name": "get_node_details",
             "arguments": {"node_id": "e2e-test-node-1"},
@@ -213,8 +276,8 @@ def test_crud_workflow():
 
     # 3. Update node
     log("  Updating node...")
-    response = httpx.post(
-        f"{SERVER_URL}/execute_tool",
+    response = CLIENT.post(
+        URL_EXEC,
         json={
             "tool_name": "update_node",
             "arguments": {
@@ -228,8 +291,8 @@ def test_crud_workflow():
 
     # 4. Get related nodes
     log("  Getting related nodes...")
-    response = httpx.post(
-        f"{SERVER_URL}/execute_tool",
+    response = CLIENT.post(
+        URL_EXEC,
         json={
             "tool_name": "get_related_nodes",
             "arguments": {"node_id": "e2e-test-node-1", "depth": 1},
@@ -238,14 +301,15 @@ def test_crud_workflow():
     assert response.status_code == 200, f"Get related failed: {response.text}"
     data = response.json()
     # Should find the connected node
-    node_ids = [n.get("id") for n in data.get("nodes", [])]
-    assert "e2e-test-node-2" in node_ids, f"Expected related node, got {node_ids}"
+    assert any(n.get("id") == "e2e-test-node-2" for n in data.get("nodes", [])), (
+        f"Expected related node, got {data.get('nodes', [])}"
+    )
     log("  ✓ Got related nodes")
 
     # 5. Delete nodes (cleanup)
     log("  Deleting test nodes...")
-    response = httpx.post(
-        f"{SERVER_URL}/execute_tool",
+    response = CLIENT.post(
+        URL_EXEC,
         json={
             "tool_name": "delete_nodes",
             "arguments": {
@@ -262,19 +326,17 @@ def test_crud_workflow():
     log("✓ CRUD workflow complete")
 
 
-def test_rest_vs_mcp_parity():
+async def test_rest_vs_mcp_parity():
     """Verify REST and MCP return equivalent data for same operations."""
     log("Testing REST vs MCP parity...")
 
-    # Get stats via REST
-    rest_response = httpx.get(f"{SERVER_URL}{API_PREFIX}/stats")
+    # Fetch stats via REST and via MCP tool concurrently
+    async with httpx.AsyncClient(http2=HTTP2_AVAILABLE, limits=ASYNC_LIMITS) as client:
+        rest_response, mcp_response = await asyncio.gather(
+            client.get(URL_STATS),
+            client.post(URL_EXEC, content=BODY_GET_STATS, headers=JSON_HEADERS),
+        )
     rest_stats = rest_response.json()
-
-    # Get stats via MCP tool
-    mcp_response = httpx.post(
-        f"{SERVER_URL}/execute_tool",
-        json={"tool_name": "get_graph_stats", "arguments": {}},
-    )
     mcp_stats = mcp_response.json()
 
     # Compare
@@ -321,7 +383,10 @@ def run_all_tests():
 
     for test in tests:
         try:
-            test()
+            if inspect.iscoroutinefunction(test):
+                asyncio.run(test())
+            else:
+                test()
             passed += 1
         except AssertionError as e:
             log(f"✗ {test.__name__} FAILED: {e}", "ERROR")